@@ -4,193 +4,513 @@ import sys
 import cv2
 import mediapipe as mp
 import numpy as np
+import queue
+import threading
 import time
+from mediapipe.tasks import python as mp_tasks
+from mediapipe.tasks.python import vision
 
-# Initialize mediapipe face mesh
-mp_face_mesh = mp.solutions.face_mesh
-face_mesh = mp_face_mesh.FaceMesh(static_image_mode=False, max_num_faces=1)
+# Numba is optional: when installed, the per-frame eye measurements are JIT-compiled
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Default Face Landmarker model bundle; the legacy FaceMesh solution is used if it hasn't been downloaded
+DEFAULT_MODEL_PATH = os.path.join(os.path.dirname(__file__), "face_landmarker.task")
 
 # Indices for eyes (from Mediapipe's 468 landmarks)
 LEFT_EYE = [33, 160, 158, 133, 153, 144]
 RIGHT_EYE = [362, 385, 387, 263, 373, 380]
 
-# Function to calculate eye aspect ratio
-def eye_aspect_ratio(eye_points, landmarks):
-    p1 = np.array(landmarks[eye_points[1]])
-    p2 = np.array(landmarks[eye_points[5]])
-    p3 = np.array(landmarks[eye_points[2]])
-    p4 = np.array(landmarks[eye_points[4]])
-    p5 = np.array(landmarks[eye_points[0]])
-    p6 = np.array(landmarks[eye_points[3]])
-    A = np.linalg.norm(p1 - p2)
-    B = np.linalg.norm(p3 - p4)
-    C = np.linalg.norm(p5 - p6)
-    ear = (A + B) / (2.0 * C)
-    return ear
+# Eye structure: [temporal_corner, top_temporal, top_nasal, nasal_corner, bottom_nasal, bottom_temporal]
+# Measured pairs per eye: (1, 5) = temporal vertical, (2, 4) = nasal vertical, (0, 3) = horizontal width
+EYE_IDX = np.array([LEFT_EYE, RIGHT_EYE])
+PAIR_START = EYE_IDX[:, [1, 2, 0]]
+PAIR_END = EYE_IDX[:, [5, 4, 3]]
+
+# Convert a list of normalized landmarks into a (N, 2) array of pixel coordinates
+def landmarks_to_pixels(lms, w, h):
+    pts = np.fromiter(((lm.x, lm.y) for lm in lms), dtype=np.dtype((np.float64, 2)), count=len(lms))
+    pts *= (w, h)
+    return pts
+
+# Vertical and horizontal distances for both eyes in one batch:
+# row 0 = left eye, row 1 = right eye; columns = [temporal, nasal, width]
+def eye_measurements(landmarks):
+    diff = landmarks[PAIR_START] - landmarks[PAIR_END]
+    return np.hypot(diff[..., 0], diff[..., 1])
+
+if njit is not None:
+    # Compiled equivalent of eye_measurements(): one loop over the six point pairs, no temporaries
+    @njit(cache=True, fastmath=True)
+    def _eye_measurements_jit(landmarks, pair_start, pair_end):
+        out = np.empty(pair_start.shape, np.float64)
+        for eye in range(pair_start.shape[0]):
+            for k in range(pair_start.shape[1]):
+                p = pair_start[eye, k]
+                q = pair_end[eye, k]
+                dx = float(landmarks[p, 0] - landmarks[q, 0])
+                dy = float(landmarks[p, 1] - landmarks[q, 1])
+                out[eye, k] = np.sqrt(dx * dx + dy * dy)
+        return out
+
+    def eye_measurements(landmarks):
+        # One float64 specialisation serves every caller, whatever its landmark dtype
+        return _eye_measurements_jit(np.asarray(landmarks, dtype=np.float64), PAIR_START, PAIR_END)
+
+# Function to calculate eye aspect ratio from eye_measurements() output
+def eye_aspect_ratio(distances):
+    return (distances[..., 0] + distances[..., 1]) / (2.0 * distances[..., 2])
+
+# Lucas-Kanade settings for following the eye points between face mesh runs
+EYE_POINTS = EYE_IDX.ravel()
+LK_PARAMS = dict(winSize=(15, 15), maxLevel=2,
+                 criteria=(cv2.TERM_CRITERIA_EPS | cv2.TERM_CRITERIA_COUNT, 10, 0.03))
+
+# Move the eye landmarks from prev_gray to gray with optical flow; None if any point is lost.
+# The other landmarks are shifted by the eye points' mean motion, so the face box used for the
+# display crop follows the head between face mesh runs
+def track_eye_points(prev_gray, gray, pts):
+    prev = pts[EYE_POINTS].astype(np.float32).reshape(-1, 1, 2)
+    nxt, status, _ = cv2.calcOpticalFlowPyrLK(prev_gray, gray, prev, None, **LK_PARAMS)
+    if nxt is None or not status.all():
+        return None
+    nxt = nxt.reshape(-1, 2)
+    tracked = pts + (nxt - prev.reshape(-1, 2)).mean(axis=0)
+    tracked[EYE_POINTS] = nxt
+    return tracked
 
 # Draw eye landmarks on the frame
 def draw_eye(frame, eye_points, landmarks, color=(0, 255, 255), thickness=1):
-    points = [landmarks[i] for i in eye_points]
-    for point in points:
-        cv2.circle(frame, point, 2, color, -1)
-    for i in range(len(points)):
-        start_point = points[i]
-        end_point = points[(i + 1) % len(points)]
-        cv2.line(frame, start_point, end_point, color, thickness)
+    pts = landmarks[eye_points].astype(np.int32)
+    for point in pts.tolist():
+        cv2.circle(frame, tuple(point), 2, color, -1)
+    cv2.polylines(frame, [pts], True, color, thickness)
     
     # Draw vertical measurement lines (temporal and nasal pairs)
     # Temporal vertical: index 1 to index 5 (top_temporal to bottom_temporal)
-    cv2.line(frame, points[1], points[5], (255, 0, 255), 2)
     # Nasal vertical: index 2 to index 4 (top_nasal to bottom_nasal)
-    cv2.line(frame, points[2], points[4], (255, 0, 255), 2)
+    cv2.polylines(frame, [pts[[1, 5]], pts[[2, 4]]], False, (255, 0, 255), 2)
 
 # EAR threshold
 EAR_THRESHOLD = 0.25
 
-# Parse optional command-line arguments (e.g., user name, output directory)
-parser = argparse.ArgumentParser(add_help=False)
-parser.add_argument("--name", type=str, default="", help="Optional user name to display on-screen")
-parser.add_argument("--outdir", type=str, default="", help="Directory to save CSV output file")
-parser.add_argument("--order", type=str, default="", help="Task order code for filename")
-parser.add_argument("--headless", action="store_true", help="Run without window (background mode)")
-args, _ = parser.parse_known_args()
-USER_NAME = args.name
-OUTDIR = args.outdir if args.outdir else os.path.dirname(__file__)
-TASK_ORDER = args.order
-HEADLESS = args.headless
-
-# Start webcam
-cap = cv2.VideoCapture(0)
-
-# Ready file used by launcher to detect when the tracker is initialized
-READY_PATH = os.path.join(os.path.dirname(__file__), "tracker.ready")
-
-# Command file for controlling the tracker
-COMMAND_PATH = os.path.join(os.path.dirname(__file__), "tracker.cmd")
-
-# Flag for writing ready file once initialization completes
-ready_written = False
-
-# Create window only if not in headless mode
-window_closed = False
-if not HEADLESS:
-    cv2.namedWindow("Eye State Detection", cv2.WINDOW_NORMAL)
-    cv2.resizeWindow("Eye State Detection", 640, 480)
-
-# Variables to track eye state
-left_eye_status = "Unknown"
-right_eye_status = "Unknown"
-
-# Data recording: list of frame data rows and recording state
-recorded_data = []
-recording = False
-current_csv_filename = None
-
-# Stabilization: track previous crop region to reduce jitter
-prev_crop = None
-
-def process_commands():
-    """Check for and process commands from the launcher."""
-    global recording, recorded_data, current_csv_filename, window_closed
-    
-    if not os.path.exists(COMMAND_PATH):
-        return True  # Continue running
+# Everything below opens the camera and the detector, so it only runs when executed as a script
+if __name__ == "__main__":
+    # Parse optional command-line arguments (e.g., user name, output directory)
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--name", type=str, default="", help="Optional user name to display on-screen")
+    parser.add_argument("--outdir", type=str, default="", help="Directory to save CSV output file")
+    parser.add_argument("--order", type=str, default="", help="Task order code for filename")
+    parser.add_argument("--headless", action="store_true", help="Run without window (background mode)")
+    parser.add_argument("--infer-width", type=int, default=320, help="Frame width used for face mesh inference (0 = full resolution)")
+    parser.add_argument("--model", type=str, default="", help="Path to a Face Landmarker .task model bundle")
+    parser.add_argument("--gpu", action="store_true", help="Run the Face Landmarker on the GPU delegate (falls back to CPU)")
+    parser.add_argument("--track-interval", type=int, default=1, help="Run face mesh every N frames, tracking eye points in between (1 = every frame)")
+    parser.add_argument("--binary", action="store_true", help="Save recordings as .npy instead of CSV (see convert_npy_to_csv.py)")
+    args, _ = parser.parse_known_args()
+    USER_NAME = args.name
+    OUTDIR = args.outdir if args.outdir else os.path.dirname(__file__)
+    TASK_ORDER = args.order
+    HEADLESS = args.headless
+    # Landmarks are normalized, so inference on a downscaled copy maps straight back to full-resolution pixels
+    INFER_WIDTH = args.infer_width
+    TRACK_INTERVAL = max(1, args.track_interval)
+    USE_GPU = args.gpu
+    MODEL_PATH = args.model if args.model else DEFAULT_MODEL_PATH
+    SAVE_BINARY = args.binary
+
+    def create_landmarker(delegate):
+        base_options = mp_tasks.BaseOptions(model_asset_path=MODEL_PATH, delegate=delegate)
+        options = vision.FaceLandmarkerOptions(base_options=base_options, num_faces=1,
+                                               running_mode=vision.RunningMode.VIDEO)
+        return vision.FaceLandmarker.create_from_options(options)
+
+    # Initialize the face landmark detector: Face Landmarker (Tasks API) when the model bundle is
+    # available - on the GPU delegate if requested, otherwise XNNPACK on CPU - else the legacy face mesh
+    landmarker = None
+    face_mesh = None
+    if os.path.exists(MODEL_PATH):
+        if USE_GPU:
+            try:
+                landmarker = create_landmarker(mp_tasks.BaseOptions.Delegate.GPU)
+                print("Face Landmarker running on GPU delegate")
+            except Exception as e:
+                print(f"GPU delegate unavailable ({e}) - falling back to CPU", file=sys.stderr)
+        if landmarker is None:
+            landmarker = create_landmarker(mp_tasks.BaseOptions.Delegate.CPU)
+    else:
+        print(f"Face Landmarker model not found at {MODEL_PATH} - using legacy face mesh", file=sys.stderr)
+        face_mesh = mp.solutions.face_mesh.FaceMesh(static_image_mode=False, max_num_faces=1)
+
+    # Video-mode timestamps must be strictly increasing
+    last_timestamp_ms = -1
+
+    def detect_face_landmarks(rgb):
+        """Run landmark inference on an RGB frame and return the first face's normalized landmarks, or None."""
+        global last_timestamp_ms
+        if landmarker is not None:
+            timestamp_ms = max(int(time.monotonic() * 1000), last_timestamp_ms + 1)
+            last_timestamp_ms = timestamp_ms
+            mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb)
+            result = landmarker.detect_for_video(mp_image, timestamp_ms)
+            return result.face_landmarks[0] if result.face_landmarks else None
+        result = face_mesh.process(rgb)
+        return result.multi_face_landmarks[0].landmark if result.multi_face_landmarks else None
+
+    # Compile the Numba kernel (or load it from cache) now rather than on the first tracked frame
+    if njit is not None:
+        eye_measurements(np.zeros((468, 2)))
+
+    # Start webcam
+    cap = cv2.VideoCapture(0)
+    # Request compressed MJPG at 640x480/30 fps (less USB bandwidth than raw YUY2) and a one-frame
+    # driver buffer so reads return the newest frame; cameras ignore properties they don't support
+    cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+    cap.set(cv2.CAP_PROP_FPS, 30)
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+    # Ready file used by launcher to detect when the tracker is initialized
+    READY_PATH = os.path.join(os.path.dirname(__file__), "tracker.ready")
+
+    # Flag for writing ready file once initialization completes
+    ready_written = False
+
+    def signal_ready():
+        """Write the ready file once so the launcher knows frames are being processed."""
+        global ready_written
+        if ready_written:
+            return
+        try:
+            with open(READY_PATH, "w") as f:
+                f.write(str(os.getpid()))
+            ready_written = True
+        except Exception:
+            pass
+
+    def clear_ready():
+        """Remove the ready file when the window closes, so the launcher knows the preview is gone."""
+        try:
+            os.remove(READY_PATH)
+        except OSError:
+            pass
+
+    def open_window():
+        cv2.namedWindow("Eye State Detection", cv2.WINDOW_NORMAL)
+        cv2.resizeWindow("Eye State Detection", 640, 480)
+
+    # Create window only if not in headless mode; the launcher can open or close it later by command
+    window_closed = HEADLESS
+    if not HEADLESS:
+        open_window()
+
+    # Variables to track eye state
+    left_eye_status = "Unknown"
+    right_eye_status = "Unknown"
+
+    # Data recording: preallocated (rows, 9) float buffer with a row count, and recording state
+    CSV_HEADER = "timestamp,left_ear,right_ear,LE_temporal,LE_nasal,RE_temporal,RE_nasal,LE_width,RE_width"
+    # Same columns as a structured dtype, so --binary .npy files carry their field names
+    RECORD_DTYPE = np.dtype([(name, np.float64) for name in CSV_HEADER.split(",")])
+    RECORD_PREALLOC = 30 * 60 * 5  # five minutes at 30 fps; grows by doubling if exceeded
+    recorded_data = np.empty((RECORD_PREALLOC, 9), dtype=np.float64)
+    recorded_count = 0
+    recording = False
+    # Background threads writing finished recordings to disk (joined on exit)
+    save_threads = []
+    current_csv_filename = None
+
+    # Stabilization: track previous crop region to reduce jitter
+    prev_crop = None
+
+    # Reusable RGB buffer for MediaPipe input (reallocated only if the inference size changes)
+    rgb_frame = None
+    # Reusable BGR buffer for the downscaled inference frame
+    small_frame = None
+
+    # Fixed-size display frame (640x480), reused across frames; display_region is the
+    # (y1, y2, x1, x2) area the zoomed face last occupied, so margins are only cleared when it moves
+    display_frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    display_region = None
+    zoom_buf = None
+
+    # Tracking between face mesh runs: last landmarks, previous grayscale frame, frames since last detection
+    last_pts = None
+    prev_gray = None
+    frames_since_detect = 0
+
+    def process_commands():
+        """Handle any commands the listener thread has received from the launcher."""
+        while True:
+            try:
+                command = command_queue.get_nowait()
+            except queue.Empty:
+                return True  # Continue running
+            if not handle_command(command):
+                return False  # Stop running
+
+    def handle_command(command):
+        """Apply a single launcher command; returns False on shutdown."""
+        global recording, recorded_data, recorded_count, current_csv_filename, window_closed, ready_written
     
-    try:
-        with open(COMMAND_PATH, "r") as f:
-            command = f.read().strip()
-        
-        # Remove command file after reading
-        os.remove(COMMAND_PATH)
+        try:
+            if command.startswith("START_RECORDING "):
+                # Format: START_RECORDING <filename>
+                filename = command[16:].strip()
+                if not recording:
+                    recorded_count = 0  # Clear previous data
+                    current_csv_filename = filename
+                    recording = True
+                    print(f"Started recording to: {filename}")
         
-        if command.startswith("START_RECORDING "):
-            # Format: START_RECORDING <filename>
-            filename = command[16:].strip()
-            if not recording:
-                recorded_data = []  # Clear previous data
-                current_csv_filename = filename
-                recording = True
-                print(f"Started recording to: {filename}")
+            elif command == "STOP_RECORDING":
+                if recording:
+                    # Hand the filled buffer to a writer thread and keep recording into a fresh one
+                    rows = recorded_data[:recorded_count]
+                    recorded_data = np.empty((RECORD_PREALLOC, 9), dtype=np.float64)
+                    save_thread = threading.Thread(target=save_recording, args=(rows, current_csv_filename))
+                    save_thread.start()
+                    save_threads.append(save_thread)
+                    recording = False
+                    print(f"Stopped recording, saved {recorded_count} frames")
+                    recorded_count = 0
+                    current_csv_filename = None
         
-        elif command == "STOP_RECORDING":
-            if recording:
-                save_csv_data()
-                recording = False
-                print(f"Stopped recording, saved {len(recorded_data)} frames")
-                recorded_data = []
-                current_csv_filename = None
+            elif command == "CLOSE_WINDOW":
+                if not window_closed:
+                    window_closed = True
+                    cv2.destroyAllWindows()
+                    clear_ready()
+                    print("Window closed by command - continuing in background...")
         
-        elif command == "CLOSE_WINDOW":
-            if not window_closed and not HEADLESS:
-                window_closed = True
-                cv2.destroyAllWindows()
-                print("Window closed by command - continuing in background...")
+            elif command == "OPEN_WINDOW":
+                if window_closed:
+                    open_window()
+                    window_closed = False
+                    # Write the ready file again once the window is displaying
+                    ready_written = False
+                    print("Window opened by command")
         
-        elif command == "SHUTDOWN":
-            print("Shutdown command received")
-            return False  # Stop running
+            elif command == "SHUTDOWN":
+                print("Shutdown command received")
+                return False  # Stop running
         
-    except Exception as e:
-        print(f"Error processing command: {e}", file=sys.stderr)
+        except Exception as e:
+            print(f"Error processing command: {e}", file=sys.stderr)
     
-    return True  # Continue running
+        return True  # Continue running
 
-def save_csv_data():
-    """Save the current recorded data to CSV."""
-    if not recorded_data or not current_csv_filename:
-        return
+    def record_row(row):
+        """Append one frame's values to the recording buffer, doubling it when full."""
+        global recorded_data, recorded_count
+        if recorded_count == len(recorded_data):
+            grown = np.empty((2 * len(recorded_data), recorded_data.shape[1]), dtype=recorded_data.dtype)
+            grown[:recorded_count] = recorded_data
+            recorded_data = grown
+        recorded_data[recorded_count] = row
+        recorded_count += 1
+
+    def save_recording(rows, filename):
+        """Save recorded rows to the output directory as CSV, or as .npy with --binary."""
+        if not len(rows) or not filename:
+            return
     
-    try:
-        csv_path = os.path.join(OUTDIR, current_csv_filename)
-        with open(csv_path, "w", encoding="utf-8") as csvf:
-            # Write header
-            csvf.write("timestamp,left_ear,right_ear,LE_temporal,LE_nasal,RE_temporal,RE_nasal,LE_width,RE_width\n")
-            # Write data rows
-            for row in recorded_data:
-                csvf.write(",".join(map(str, row)) + "\n")
-        print(f"Saved {len(recorded_data)} frames to: {csv_path}")
-    except Exception as e:
-        print(f"Failed to save CSV: {e}", file=sys.stderr)
+        try:
+            if SAVE_BINARY:
+                # The buffer already holds the binary layout; write it without any text formatting
+                npy_path = os.path.join(OUTDIR, os.path.splitext(filename)[0] + ".npy")
+                np.save(npy_path, np.ascontiguousarray(rows).view(RECORD_DTYPE).ravel())
+                print(f"Saved {len(rows)} frames to: {npy_path}")
+                return
+            csv_path = os.path.join(OUTDIR, filename)
+            np.savetxt(csv_path, rows, fmt="%.6f", delimiter=",",
+                       header=CSV_HEADER, comments="", encoding="utf-8")
+            print(f"Saved {len(rows)} frames to: {csv_path}")
+        except Exception as e:
+            print(f"Failed to save recording: {e}", file=sys.stderr)
 
-try:
-    while True:
-        # Process commands from launcher
-        if not process_commands():
-            break  # Shutdown command received
+    def locate_landmarks(frame):
+        """Return the (N, 2) pixel landmarks for a BGR frame, or None if no face was found."""
+        global rgb_frame, small_frame, last_pts, prev_gray, frames_since_detect
+        h, w = frame.shape[:2]
+        # Between face mesh runs, reuse the last landmarks and follow the eye points with optical flow
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if TRACK_INTERVAL > 1 else None
+        pts = None
+        if last_pts is not None and frames_since_detect < TRACK_INTERVAL - 1:
+            pts = track_eye_points(prev_gray, gray, last_pts)
+        if pts is not None:
+            frames_since_detect += 1
+        else:
+            # Downscale for inference (aspect ratio preserved) before converting to RGB
+            if 0 < INFER_WIDTH < w:
+                infer_size = (INFER_WIDTH, round(h * INFER_WIDTH / w))
+                if small_frame is None or small_frame.shape[1::-1] != infer_size:
+                    small_frame = np.empty((infer_size[1], infer_size[0], 3), dtype=np.uint8)
+                cv2.resize(frame, infer_size, dst=small_frame, interpolation=cv2.INTER_AREA)
+                bgr_input = small_frame
+            else:
+                bgr_input = frame
+            # Convert colour on the smaller frame only
+            if rgb_frame is None or rgb_frame.shape != bgr_input.shape:
+                rgb_frame = np.empty_like(bgr_input)
+            cv2.cvtColor(bgr_input, cv2.COLOR_BGR2RGB, dst=rgb_frame)
+            face_landmarks = detect_face_landmarks(rgb_frame)
+            if face_landmarks is not None:
+                # Get original landmarks in original frame coordinates
+                pts = landmarks_to_pixels(face_landmarks, w, h)
+            frames_since_detect = 0
+        last_pts = pts
+        prev_gray = gray
+        return pts
+
+    # Pipeline stages: capture thread -> inference thread -> main thread (commands, recording, display).
+    # Bounded queues drop the oldest item so each stage always works on the most recent frame.
+    frame_queue = queue.Queue(maxsize=2)
+    result_queue = queue.Queue(maxsize=2)
+    stop_event = threading.Event()
+
+    # Launcher commands arrive one per line on stdin; a listener thread blocks reading them and
+    # queues each one for the main loop
+    command_queue = queue.Queue()
+
+    def put_latest(q, item):
+        """Put item on a bounded queue, discarding the oldest entry if the queue is full."""
+        while True:
+            try:
+                q.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    q.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def command_listener():
+        """Queue each command line the launcher writes to stdin, until stdin is closed."""
+        if sys.stdin is None:
+            return
+        # Read the raw file descriptor: a daemon thread blocked inside sys.stdin's buffered reader
+        # would hold its lock and abort the interpreter at shutdown
+        pending = b""
+        try:
+            fd = sys.stdin.fileno()
+            while True:
+                chunk = os.read(fd, 4096)
+                if not chunk:
+                    break  # stdin closed
+                pending += chunk
+                *lines, pending = pending.split(b"\n")
+                for line in lines:
+                    command = line.decode("utf-8", errors="replace").strip()
+                    if command:
+                        command_queue.put(command)
+        except Exception as e:
+            print(f"Error reading command: {e}", file=sys.stderr)
+
+    def capture_loop():
+        """Read camera frames (stamped at capture time) until stopped or the camera fails."""
+        while not stop_event.is_set():
+            ret, frame = cap.read()
+            if not ret:
+                break
+            put_latest(frame_queue, (time.time(), frame))
+        put_latest(frame_queue, None)
+
+    def inference_loop():
+        """Run landmark detection on captured frames and hand results to the main thread."""
+        while True:
+            item = frame_queue.get()
+            if item is None:
+                break
+            timestamp, frame = item
+            try:
+                pts = locate_landmarks(frame)
+            except Exception as e:
+                print(f"Landmark detection failed: {e}", file=sys.stderr)
+                pts = None
+            put_latest(result_queue, (timestamp, frame, pts))
+        put_latest(result_queue, None)
+
+    capture_thread = threading.Thread(target=capture_loop, daemon=True)
+    inference_thread = threading.Thread(target=inference_loop, daemon=True)
+    command_thread = threading.Thread(target=command_listener, daemon=True)
+
+    try:
+        capture_thread.start()
+        inference_thread.start()
+        command_thread.start()
+        while True:
+            # Process commands from launcher
+            if not process_commands():
+                break  # Shutdown command received
         
-        ret, frame = cap.read()
-        if not ret:
-            break
+            try:
+                item = result_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue  # Keep handling commands while waiting for the camera
+            if item is None:
+                break  # Camera stopped delivering frames
+            timestamp, frame, pts = item
 
-        h, w = frame.shape[:2]
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        result = face_mesh.process(rgb_frame)
+            h, w = frame.shape[:2]
 
-        # Create a fixed-size display frame (640x480)
-        display_frame = np.zeros((480, 640, 3), dtype=np.uint8)
+            if pts is not None:
+                orig_landmarks = pts.astype(np.int32)
 
-        if result.multi_face_landmarks:
-            for face_landmarks in result.multi_face_landmarks:
-                # Get original landmarks in original frame coordinates
-                orig_landmarks = [(int(lm.x * w), int(lm.y * h)) for lm in face_landmarks.landmark]
-                
+                # Record frame data: timestamp, EARs, vertical distances, horizontal widths
+                # (measured on the unrounded camera-frame landmarks, so values are in original image pixels)
+                distances = eye_measurements(pts)
+                (le_temp_vert, le_nasal_vert, le_width), (re_temp_vert, re_nasal_vert, re_width) = distances
+                left_ear, right_ear = eye_aspect_ratio(distances)
+                avg_ear = (left_ear + right_ear) / 2.0
+
+                # Record row only if recording is active
+                if recording:
+                    record_row((
+                        timestamp,
+                        left_ear,
+                        right_ear,
+                        le_temp_vert,
+                        le_nasal_vert,
+                        re_temp_vert,
+                        re_nasal_vert,
+                        le_width,
+                        re_width
+                    ))
+
+                # Determine eye states (for data recording only; display always uses fixed colour)
+                if left_ear < EAR_THRESHOLD:
+                    left_eye_status = "Closed"
+                else:
+                    left_eye_status = "Open"
+            
+                if right_ear < EAR_THRESHOLD:
+                    right_eye_status = "Closed"
+                else:
+                    right_eye_status = "Open"
+
+            # Crop, zoom and draw only when there is a window to show the result in
+            if pts is not None and not window_closed:
+                landmarks = orig_landmarks
+            
                 # Calculate face bounding box
-                xs = [lm.x * w for lm in face_landmarks.landmark]
-                ys = [lm.y * h for lm in face_landmarks.landmark]
-                face_x_min, face_x_max = int(min(xs)), int(max(xs))
-                face_y_min, face_y_max = int(min(ys)), int(max(ys))
-                
+                face_x_min, face_y_min = (int(v) for v in pts.min(axis=0))
+                face_x_max, face_y_max = (int(v) for v in pts.max(axis=0))
+            
                 # Add padding and calculate crop region
                 face_w = face_x_max - face_x_min
                 face_h = face_y_max - face_y_min
                 pad_w = int(face_w * 1.2)  # More padding = less zoom
                 pad_h = int(face_h * 1.2)
-                
+            
                 crop_x1 = max(0, face_x_min - pad_w)
                 crop_y1 = max(0, face_y_min - pad_h)
                 crop_x2 = min(w, face_x_max + pad_w)
                 crop_y2 = min(h, face_y_max + pad_h)
-                
+            
                 # Stabilization: only update crop if face moved significantly from previous position
                 if prev_crop is not None:
                     prev_x1, prev_y1, prev_x2, prev_y2 = prev_crop
@@ -199,18 +519,18 @@ try:
                     prev_cy = (prev_y1 + prev_y2) // 2
                     curr_cx = (crop_x1 + crop_x2) // 2
                     curr_cy = (crop_y1 + crop_y2) // 2
-                    
+                
                     # Only update if moved more than 15% of face width/height
                     threshold_x = face_w * 0.15
                     threshold_y = face_h * 0.15
-                    
+                
                     if abs(curr_cx - prev_cx) < threshold_x and abs(curr_cy - prev_cy) < threshold_y:
                         # Use previous crop region (stabilize)
                         crop_x1, crop_y1, crop_x2, crop_y2 = prev_crop
-                
+            
                 # Store current crop for next frame
                 prev_crop = (crop_x1, crop_y1, crop_x2, crop_y2)
-                
+            
                 # Crop the face region
                 cropped = frame[crop_y1:crop_y2, crop_x1:crop_x2]
                 if cropped.size > 0:
@@ -219,137 +539,90 @@ try:
                     scale = min(640 / crop_w, 480 / crop_h) * 1.5  # 1.5x zoom instead of 2x
                     new_w = int(crop_w * scale)
                     new_h = int(crop_h * scale)
-                    
-                    zoomed = cv2.resize(cropped, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
-                    
+                
                     # Center the zoomed image in the display frame
                     y_offset = max(0, (480 - new_h) // 2)
                     x_offset = max(0, (640 - new_w) // 2)
-                    
+                
                     # Handle cases where zoomed image is larger than display
-                    y_crop_start = 0
-                    x_crop_start = 0
-                    if new_h > 480:
-                        y_crop_start = (new_h - 480) // 2
-                        zoomed = zoomed[y_crop_start:y_crop_start + 480, :]
-                        new_h = 480
-                        y_offset = 0
-                    if new_w > 640:
-                        x_crop_start = (new_w - 640) // 2
-                        zoomed = zoomed[:, x_crop_start:x_crop_start + 640]
-                        new_w = 640
-                        x_offset = 0
-                    
-                    display_frame[y_offset:y_offset + new_h, x_offset:x_offset + new_w] = zoomed
-                    
-                    # Transform landmarks to display frame coordinates
-                    display_landmarks = []
-                    for x, y in orig_landmarks:
-                        # Translate to crop coordinates
-                        x_crop = x - crop_x1
-                        y_crop = y - crop_y1
-                        # Scale
-                        x_scaled = x_crop * scale
-                        y_scaled = y_crop * scale
-                        # Adjust for zoom cropping
-                        x_final = x_scaled - x_crop_start + x_offset
-                        y_final = y_scaled - y_crop_start + y_offset
-                        display_landmarks.append((int(x_final), int(y_final)))
-                    
-                    landmarks = display_landmarks
-                    frame = display_frame
-                    h, w = 480, 640
+                    y_crop_start = max(0, (new_h - 480) // 2)
+                    x_crop_start = max(0, (new_w - 640) // 2)
+                    out_h = min(new_h, 480)
+                    out_w = min(new_w, 640)
                 
-                left_ear = eye_aspect_ratio(LEFT_EYE, landmarks)
-                right_ear = eye_aspect_ratio(RIGHT_EYE, landmarks)
-                avg_ear = (left_ear + right_ear) / 2.0
-
-                # Record frame data: timestamp, EARs, vertical distances, horizontal widths
-                # LEFT_EYE = [33, 160, 158, 133, 153, 144]
-                # RIGHT_EYE = [362, 385, 387, 263, 373, 380]
-                # Eye structure: [temporal_corner, top_temporal, top_nasal, nasal_corner, bottom_nasal, bottom_temporal]
-                # Vertical pairs: (index 1, index 5) = temporal vertical, (index 2, index 4) = nasal vertical
-                # Horizontal: (index 0, index 3) = temporal to nasal
-
-                # Left eye measurements
-                le_temp_vert = np.linalg.norm(np.array(landmarks[LEFT_EYE[1]]) - np.array(landmarks[LEFT_EYE[5]]))
-                le_nasal_vert = np.linalg.norm(np.array(landmarks[LEFT_EYE[2]]) - np.array(landmarks[LEFT_EYE[4]]))
-                le_width = np.linalg.norm(np.array(landmarks[LEFT_EYE[0]]) - np.array(landmarks[LEFT_EYE[3]]))
-
-                # Right eye measurements
-                re_temp_vert = np.linalg.norm(np.array(landmarks[RIGHT_EYE[1]]) - np.array(landmarks[RIGHT_EYE[5]]))
-                re_nasal_vert = np.linalg.norm(np.array(landmarks[RIGHT_EYE[2]]) - np.array(landmarks[RIGHT_EYE[4]]))
-                re_width = np.linalg.norm(np.array(landmarks[RIGHT_EYE[0]]) - np.array(landmarks[RIGHT_EYE[3]]))
-
-                # Record row only if recording is active
-                if recording:
-                    recorded_data.append([
-                        time.time(),
-                        left_ear,
-                        right_ear,
-                        le_temp_vert,
-                        le_nasal_vert,
-                        re_temp_vert,
-                        re_nasal_vert,
-                        le_width,
-                        re_width
-                    ])
-
-                # Determine eye states (for data recording only; display always uses fixed colour)
-                if left_ear < EAR_THRESHOLD:
-                    left_eye_status = "Closed"
-                else:
-                    left_eye_status = "Open"
+                    # Clear stale margins only when the zoomed region moves or changes size
+                    region = (y_offset, y_offset + out_h, x_offset, x_offset + out_w)
+                    if region != display_region:
+                        display_frame[:] = 0
+                        display_region = region
+                    target = display_frame[y_offset:y_offset + out_h, x_offset:x_offset + out_w]
                 
-                if right_ear < EAR_THRESHOLD:
-                    right_eye_status = "Closed"
-                else:
-                    right_eye_status = "Open"
+                    if new_w <= 640 and new_h <= 480:
+                        # Resize straight into the display frame
+                        cv2.resize(cropped, (new_w, new_h), dst=target, interpolation=cv2.INTER_LINEAR)
+                    else:
+                        # Resize into a persistent buffer, then copy its centre into the display frame
+                        if zoom_buf is None or zoom_buf.shape[:2] != (new_h, new_w):
+                            zoom_buf = np.empty((new_h, new_w, 3), dtype=np.uint8)
+                        cv2.resize(cropped, (new_w, new_h), dst=zoom_buf, interpolation=cv2.INTER_LINEAR)
+                        target[:] = zoom_buf[y_crop_start:y_crop_start + out_h, x_crop_start:x_crop_start + out_w]
+                
+                    # Transform landmarks to display frame coordinates in one affine step:
+                    # translate to crop coordinates, scale, then adjust for zoom cropping
+                    crop_origin = np.array([crop_x1, crop_y1])
+                    display_shift = np.array([x_offset - x_crop_start, y_offset - y_crop_start])
+                    landmarks = ((orig_landmarks - crop_origin) * scale + display_shift).astype(np.int32)
+                    frame = display_frame
+                    h, w = 480, 640
 
                 # Draw eyes with a fixed colour (cyan) — no live open/closed indication
                 draw_eye(frame, LEFT_EYE, landmarks, color=(0, 255, 255))
                 draw_eye(frame, RIGHT_EYE, landmarks, color=(0, 255, 255))
 
-        # Show frame only if not in headless mode and window hasn't been closed
-        if not HEADLESS and not window_closed:
-            cv2.imshow("Eye State Detection", frame)
-            # Signal ready only after the window is actually displaying
-            if not ready_written:
-                try:
-                    with open(READY_PATH, "w") as f:
-                        f.write(str(os.getpid()))
-                    ready_written = True
-                except Exception:
-                    pass
-            key = cv2.waitKey(1) & 0xFF
-            # Check if window is closed (user clicked X) - switch to headless mode
-            if cv2.getWindowProperty("Eye State Detection", cv2.WND_PROP_VISIBLE) < 1:
-                window_closed = True
-                cv2.destroyAllWindows()
-                print("Window closed - continuing tracking in background...")
-            # Exit completely on ESC key
-            elif key == 27:
-                break
-        elif HEADLESS or window_closed:
-            # In headless mode, just wait a bit to avoid busy loop
-            time.sleep(0.01)
-finally:
-    # If still recording, save the current data
-    if recording and recorded_data:
-        save_csv_data()
+            # Show frame only if the window is open (not headless and not closed)
+            if not window_closed:
+                cv2.imshow("Eye State Detection", frame)
+                # Signal ready only after the window is actually displaying
+                signal_ready()
+                key = cv2.waitKey(1) & 0xFF
+                # Check if window is closed (user clicked X) - switch to headless mode
+                if cv2.getWindowProperty("Eye State Detection", cv2.WND_PROP_VISIBLE) < 1:
+                    window_closed = True
+                    cv2.destroyAllWindows()
+                    clear_ready()
+                    print("Window closed - continuing tracking in background...")
+                # Exit completely on ESC key
+                elif key == 27:
+                    break
+            else:
+                # Without a window, signal ready once the first frame has been processed
+                signal_ready()
+    finally:
+        # If still recording, save the current data
+        if recording and recorded_count:
+            save_recording(recorded_data[:recorded_count], current_csv_filename)
+        # Wait for recordings stopped earlier to finish writing
+        for save_thread in save_threads:
+            save_thread.join()
     
-    # Cleanup: remove ready and command files if they exist
-    try:
-        if ready_written and os.path.exists(READY_PATH):
-            os.remove(READY_PATH)
-    except Exception:
-        pass
+        # Cleanup: remove the ready file if it exists
+        try:
+            if ready_written and os.path.exists(READY_PATH):
+                os.remove(READY_PATH)
+        except Exception:
+            pass
     
-    try:
-        if os.path.exists(COMMAND_PATH):
-            os.remove(COMMAND_PATH)
-    except Exception:
-        pass
+        # Stop the pipeline threads before releasing the camera and detector they use
+        stop_event.set()
+        if capture_thread.is_alive():
+            capture_thread.join(timeout=2)
+        if inference_thread.is_alive():
+            inference_thread.join(timeout=2)
+        # The command listener is left to exit with the process: it may be blocked reading stdin
     
-    cap.release()
-    cv2.destroyAllWindows()
+        if landmarker is not None:
+            landmarker.close()
+        else:
+            face_mesh.close()
+        cap.release()
+        cv2.destroyAllWindows()
@@ -0,0 +1,24 @@
+import os
+import sys
+import numpy as np
+
+def main():
+    # Convert recordings saved with Eye_State_Detector.py --binary into the usual CSV format
+    import argparse
+    parser = argparse.ArgumentParser(description="Convert binary eye tracking recordings (.npy) to CSV")
+    parser.add_argument('files', nargs='+', help="Recording .npy files; each is written next to it as .csv")
+    args = parser.parse_args()
+
+    for npy_path in args.files:
+        try:
+            data = np.load(npy_path)
+            csv_path = os.path.splitext(npy_path)[0] + ".csv"
+            columns = np.column_stack([data[name] for name in data.dtype.names])
+            np.savetxt(csv_path, columns, fmt="%.6f", delimiter=",",
+                       header=",".join(data.dtype.names), comments="", encoding="utf-8")
+            print(f"Converted {len(data)} frames to: {csv_path}")
+        except Exception as e:
+            print(f"Failed to convert {npy_path}: {e}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
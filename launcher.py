@@ -1,4 +1,5 @@
-import glob
+import functools
+import importlib
 import json
 import os
 import subprocess
@@ -6,11 +7,54 @@ import sys
 import threading
 import time
 import tkinter as tk
-from tkinter import filedialog, font, messagebox
+from datetime import datetime
+# filedialog and messagebox are imported where they are used, so a launcher
+# session that never opens a dialog doesn't pay for importing them
+from tkinter import font
+
+# orjson is optional; it encodes and decodes the config faster than the json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# watchdog is optional; with it the launcher is told when the ready file appears instead of
+# finding out on the next poll
+try:
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None
 
 
 ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
 
+# Files the launcher reads and writes, resolved once
+CONFIG_PATH = os.path.join(ROOT_DIR, "launcher_config.json")
+TRACKER_READY_PATH = os.path.join(ROOT_DIR, "tracker.ready")
+TRACKER_SCRIPT = os.path.join(ROOT_DIR, "Eye_State_Detector.py")
+
+# Run the tracker with the current Python interpreter (so a venv works if launcher is run from it)
+PYTHON_EXECUTABLE = sys.executable
+DEFAULT_TRIVIA_PATH = os.path.join(ROOT_DIR, "trivia_general_knowledge.json")
+
+# Prefixes that mark the reading task as a web page rather than a local file
+_URL_PREFIXES = ("http://", "https://")
+
+# File dialog filters for the Setup window's task rows
+_READING_FILETYPES = (
+    ("Webpage URL", "*.url"),
+    ("Text files", "*.txt *.pdf"),
+    ("All files", "*.*"),
+)
+_VIDEO_FILETYPES = (
+    ("Video files", "*.mp4 *.avi *.mov *.mkv *.wmv *.flv *.webm *.m4v *.mpeg *.mpg"),
+    ("All files", "*.*"),
+)
+_INTERACTIVE_FILETYPES = (
+    ("JSON files", "*.json"),
+    ("All files", "*.*"),
+)
+
 # Task order permutations (6 possible orders for 3 tasks)
 # Order number is determined by (file_count % 6)
 TASK_ORDERS = {
@@ -28,9 +72,109 @@ def get_order_code(task_list):
     return ''.join(task[0] for task in task_list)
 
 
-def find_python_executable():
-    # Prefer the current Python interpreter (so a venv works if launcher is run from it)
-    return sys.executable
+# Letter code for each order number, computed once
+TASK_ORDER_CODES = {num: get_order_code(tasks) for num, tasks in TASK_ORDERS.items()}
+
+
+def existing_paths(paths):
+    """Return the subset of paths that exist, listing each parent directory only once.
+    
+    Config paths usually share a folder, so this replaces one stat per path with one
+    directory read per folder. Unreadable folders fall back to os.path.exists.
+    """
+    found = set()
+    listings = {}
+    for path in paths:
+        parent, base = os.path.split(os.path.normpath(path))
+        if parent not in listings:
+            try:
+                listings[parent] = {os.path.normcase(n) for n in os.listdir(parent or os.curdir)}
+            except OSError:
+                listings[parent] = None
+        names = listings[parent]
+        if names is None or not base:
+            if os.path.exists(path):
+                found.add(path)
+        elif os.path.normcase(base) in names:
+            found.add(path)
+    return found
+
+
+# Plain config settings as (key, default, type); the save directory and task paths are
+# validated separately in _load_config. last_name is saved from the current entry text.
+_CONFIG_SETTINGS = (
+    ("sande", False, bool),
+    ("osdi6", False, bool),
+    ("demographics", True, bool),
+    ("last_name", "", str),
+    ("duration_minutes", 5, int),
+)
+
+
+def _coerce_setting(value, default, cast):
+    """Convert a config value with cast, falling back to default if it is missing or invalid."""
+    if value is None:
+        return default
+    try:
+        return cast(value)
+    except (ValueError, TypeError):
+        return default
+
+
+@functools.lru_cache(maxsize=64)
+def _shorten(path, n=60, ellipsis="..."):
+    """Return path, or its last characters behind an ellipsis, so it is at most n characters long.
+
+    Cached, since the same few paths are shortened each time Setup opens or a file is chosen.
+    """
+    return path if len(path) <= n else f"{ellipsis}{path[-(n - len(ellipsis)):]}"
+
+
+def _config_dumps(data):
+    """Encode the config dict as indented UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(data, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _config_loads(raw):
+    """Decode config bytes read from launcher_config.json."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@functools.lru_cache(maxsize=2)
+def _minute_stamp(minute):
+    """Format a minute count since the epoch as YYYYMMDDTHHMM (local time); cached per minute."""
+    return datetime.fromtimestamp(minute * 60).strftime("%Y%m%dT%H%M")
+
+
+class _ReadyFileWatcher:
+    """Watch ROOT_DIR with watchdog and set the seen event when tracker.ready appears.
+
+    dispatch() runs on the observer thread, so it makes no Tk calls; the launcher's
+    _poll_ready after-loop reads the event on the Tk thread.
+    """
+
+    def __init__(self):
+        self.seen = threading.Event()
+        self._ready_path = os.path.normcase(TRACKER_READY_PATH)
+        self._observer = Observer()
+        # The observer only needs a dispatch(event) method, so this object is the handler
+        self._observer.schedule(self, ROOT_DIR, recursive=False)
+        self._observer.start()
+
+    def dispatch(self, event):
+        if self.seen.is_set() or event.event_type not in ("created", "moved", "modified"):
+            return
+        path = getattr(event, "dest_path", "") or event.src_path
+        if os.path.normcase(os.fsdecode(path)) == self._ready_path:
+            self.seen.set()
+
+    def stop(self):
+        self._observer.stop()
+        self._observer.join(timeout=2)
 
 
 class Launcher(tk.Tk):
@@ -41,14 +185,15 @@ class Launcher(tk.Tk):
         self.process = None
 
         # Center window
-        self.width = 420
+        self.width = 500
         # Make window taller so the directory label can wrap to multiple lines
         self.height = 300
         self._center_window()
 
-        # Styling
+        # Styling - fonts are created once and shared by the Setup window and dialogs
         header_font = font.Font(family="Segoe UI", size=16, weight="bold")
         label_font = font.Font(family="Segoe UI", size=11)
+        self.dialog_font = font.Font(family="Segoe UI", size=10)
 
         header = tk.Label(self, text="Blink or they're gone!", bg="#1f2937", fg="#ffffff", font=header_font)
         header.pack(pady=(14, 6))
@@ -60,6 +205,9 @@ class Launcher(tk.Tk):
         entry_frame.pack(pady=(0, 8))
 
         self.name_var = tk.StringVar()
+        # Participant name with surrounding whitespace removed, kept current as the entry is edited
+        self.participant_name = ""
+        self.name_var.trace_add("write", self._on_name_changed)
         name_entry = tk.Entry(entry_frame, textvariable=self.name_var, width=30, font=label_font)
         name_entry.pack(ipady=6, padx=6)
         name_entry.focus()
@@ -71,6 +219,10 @@ class Launcher(tk.Tk):
         self.preview_btn = tk.Button(btn_frame, text="Preview", command=self.toggle_preview, bg="#3b82f6", fg="#fff", padx=12, pady=8, relief="flat", font=label_font)
         self.preview_btn.pack(side="left", padx=4)
 
+        # Stop camera button (stop the warm tracker process) - enabled while a tracker is running
+        self.stop_btn = tk.Button(btn_frame, text="Stop camera", command=self.stop_camera, bg="#6b7280", fg="#d1d5db", padx=10, pady=8, relief="flat", font=label_font, state="disabled")
+        self.stop_btn.pack(side="left", padx=4)
+
         # Start button (run full experiment with sequential tasks) - disabled until preview is verified
         self.start_btn = tk.Button(btn_frame, text="Start", command=self.start_experiment, bg="#6b7280", fg="#d1d5db", padx=12, pady=8, relief="flat", font=label_font, state="disabled")
         self.start_btn.pack(side="left", padx=4)
@@ -95,7 +247,21 @@ class Launcher(tk.Tk):
         self.duration_minutes = 5  # Default 5 minutes
         self.task_order_override = None  # None = auto-calculate; int 0-5 = manual override
         self._needs_config_save = False  # Flag for deferred config save
+        self._cfg_dirty = False  # Setup changes not yet written to launcher_config.json
+        self._cfg_after_id = None  # Pending _flush_config callback
+        self._last_config_text = None  # Contents of launcher_config.json as last loaded/saved
+        self._csv_count_cache = None  # (save_dir, dir mtime, CSV filenames) from the last scan
         self._preview_verified = False  # Track if preview has been successfully run
+        self._preview_open = False  # Whether the tracker's preview window is (being) shown
+        self._experiment_running = False  # Whether _run_experiment_sequence is in progress (tasks may be recording)
+        self._watching_process = False  # Whether the _watch_process loop is scheduled
+        self._ready_poll_id = None  # Pending _poll_ready callback while waiting for the tracker
+        self._ready_watcher = None  # _ReadyFileWatcher while waiting, if watchdog is installed
+        self._tooltip = None  # Shared tooltip window, created on first hover
+        self._tooltip_var = None
+        # Labels that show a tooltip get the "TooltipLabel" bind tag and a _tooltip_text callable
+        self.bind_class("TooltipLabel", "<Enter>", self._on_tooltip_enter)
+        self.bind_class("TooltipLabel", "<Leave>", self._on_tooltip_leave)
 
         # Load saved config (if any)
         self._load_config()
@@ -107,9 +273,8 @@ class Launcher(tk.Tk):
 
         # Set default trivia file if not already set
         if not self.task_interactive:
-            default_trivia = os.path.join(ROOT_DIR, "trivia_general_knowledge.json")
-            if os.path.exists(default_trivia):
-                self.task_interactive = default_trivia
+            if os.path.exists(DEFAULT_TRIVIA_PATH):
+                self.task_interactive = DEFAULT_TRIVIA_PATH
                 self._needs_config_save = True
         
         # Save config if files were cleared or defaults were set
@@ -120,7 +285,7 @@ class Launcher(tk.Tk):
         # Calculate task order based on existing files (or use manual override)
         self.task_order_num = self.task_order_override if self.task_order_override is not None else self._calculate_task_order()
         self.task_order = TASK_ORDERS[self.task_order_num]
-        self.task_order_code = get_order_code(self.task_order)
+        self.task_order_code = TASK_ORDER_CODES[self.task_order_num]
         
         # Display task order code on home screen (blinded - only show letter code)
         self.order_label = tk.Label(self, text=f"Task Order: {self.task_order_code}", 
@@ -129,10 +294,35 @@ class Launcher(tk.Tk):
 
         self.status_label = tk.Label(self, text="Status: Idle", bg="#1f2937", fg="#9ca3af", font=label_font)
         self.status_label.pack(pady=(8, 0))
+        self._last_status = ("Status: Idle", "#9ca3af")  # (text, colour) currently shown
 
         # Close behavior
         self.protocol("WM_DELETE_WINDOW", self.on_close)
 
+        # Import the task windows while the operator is still on the home screen
+        self.after_idle(self._preload_task_modules)
+
+    def _preload_task_modules(self):
+        """Import the task window modules so starting each task hits the module cache.
+
+        The task runners keep their local imports; this only moves the one-off import
+        cost (webview, VLC bindings) out of the experiment sequence.
+        """
+        for module_name in ("reading_window", "video_player", "questionnaires"):
+            try:
+                importlib.import_module(module_name)
+            except Exception as e:
+                print(f"[DEBUG] Could not preload {module_name}: {e}", file=sys.stderr)
+
+    def _on_name_changed(self, *_):
+        self.participant_name = self.name_var.get().strip()
+
+    def _set_status(self, text, fg):
+        """Show text in the status line, skipping the Tk call when it is already shown."""
+        if (text, fg) != self._last_status:
+            self._last_status = (text, fg)
+            self.status_label.config(text=text, fg=fg)
+
     def _center_window(self):
         screen_w = self.winfo_screenwidth()
         screen_h = self.winfo_screenheight()
@@ -141,41 +331,76 @@ class Launcher(tk.Tk):
         self.geometry(f"{self.width}x{self.height}+{x}+{y}")
     
     def _send_tracker_command(self, command):
-        """Send a command to the eye tracker via command file."""
-        command_path = os.path.join(ROOT_DIR, "tracker.cmd")
+        """Send a command to the eye tracker as one line on its stdin pipe."""
         try:
-            with open(command_path, "w") as f:
-                f.write(command)
+            if self.process is None or self.process.stdin is None:
+                raise RuntimeError("eye tracker is not running")
+            self.process.stdin.write(command.encode("utf-8") + b"\n")
+            self.process.stdin.flush()
             print(f"[DEBUG] Sent command: {command}", file=sys.stderr)
         except Exception as e:
             print(f"[ERROR] Failed to send command: {e}", file=sys.stderr)
     
+    def _wait_until(self, predicate, timeout, interval_ms=50):
+        """Keep the Tk event loop running until predicate() is true or timeout seconds pass.
+        
+        Returns the final value of predicate(). Unlike time.sleep or Popen.wait, the UI keeps
+        redrawing and handling events while waiting.
+        """
+        done = tk.BooleanVar(self, value=False)
+        deadline = time.monotonic() + timeout
+        
+        def check():
+            if predicate() or time.monotonic() >= deadline:
+                done.set(True)
+            else:
+                self.after(interval_ms, check)
+        
+        check()
+        if not done.get():
+            self.wait_variable(done)
+        return predicate()
+    
+    def _start_recording(self, csv_filename):
+        """Tell the tracker to start recording to csv_filename in the current save directory."""
+        # Send the full path: a tracker kept running from preview may predate a save directory change
+        self._send_tracker_command(f"START_RECORDING {os.path.join(self.save_dir or ROOT_DIR, csv_filename)}")
+    
     def _generate_csv_filename(self, task_suffix):
         """Generate CSV filename: YYYYMMDDTHHMM-{participant}-{order}-{task}.csv"""
-        from datetime import datetime
-        timestamp_str = datetime.now().strftime("%Y%m%dT%H%M")
-        name = self.name_var.get().strip()
+        timestamp_str = _minute_stamp(int(time.time() // 60))
+        name = self.participant_name
         name_suffix = f"-{name}" if name else ""
         order_suffix = f"-{self.task_order_code}"
-        return f"{timestamp_str}{name_suffix}{order_suffix}-{task_suffix}.csv"
+        filename = f"{timestamp_str}{name_suffix}{order_suffix}-{task_suffix}.csv"
+        # The listing from the last order calculation is enough to spot a clash with an earlier recording
+        if self._csv_count_cache and self._csv_count_cache[0] == self.save_dir and filename in self._csv_count_cache[2]:
+            print(f"[WARNING] {filename} already exists in the save directory and will be overwritten", file=sys.stderr)
+        return filename
     
     def _calculate_task_order(self):
         """Count existing CSV files in save directory and return order number (0-5)."""
         if not self.save_dir or not os.path.isdir(self.save_dir):
             return 0
         
-        # Count CSV files matching the pattern YYYYMMDDTHHMM-*.csv
-        csv_files = glob.glob(os.path.join(self.save_dir, "*-*.csv"))
-        file_count = len(csv_files)
+        # Reuse the previous listing while the directory is unchanged (adding or removing files updates its mtime)
+        dir_mtime = os.stat(self.save_dir).st_mtime_ns
+        if not self._csv_count_cache or self._csv_count_cache[:2] != (self.save_dir, dir_mtime):
+            # Collect CSV files matching the pattern YYYYMMDDTHHMM-*.csv; scandir entries already
+            # carry the file type, so no per-file stat is needed
+            with os.scandir(self.save_dir) as entries:
+                csv_names = frozenset(e.name for e in entries
+                                      if e.name.endswith(".csv") and "-" in e.name and not e.name.startswith(".") and e.is_file())
+            self._csv_count_cache = (self.save_dir, dir_mtime, csv_names)
+        file_count = len(self._csv_count_cache[2])
         
         print(f"[DEBUG] Found {file_count} existing CSV files, order = {file_count % 6}", file=sys.stderr)
         return file_count % 6
 
     def start_tracker(self):
         # Start process and begin polling for readiness
-        name = self.name_var.get().strip()
-        python_exe = find_python_executable()
-        cmd = [python_exe, os.path.join(ROOT_DIR, "Eye_State_Detector.py")]
+        name = self.participant_name
+        cmd = [PYTHON_EXECUTABLE, TRACKER_SCRIPT]
         if name:
             cmd += ["--name", name]
         # Pass save directory if configured
@@ -185,22 +410,28 @@ class Launcher(tk.Tk):
         cmd += ["--order", self.task_order_code]
 
         try:
-            self.process = subprocess.Popen(cmd, cwd=ROOT_DIR)
-            self._ready_confirmed = False
+            # Remove a stale ready file so it isn't mistaken for this tracker's
+            if os.path.exists(TRACKER_READY_PATH):
+                os.remove(TRACKER_READY_PATH)
+            self.process = subprocess.Popen(cmd, cwd=ROOT_DIR, stdin=subprocess.PIPE)
+            self._preview_open = True
+            self.stop_btn.config(state="normal", bg="#ef4444", fg="#fff")
             self._start_prewarm_messages()
             # Update UI to show initializing state
             self.preview_btn.config(text="Initializing...", state="disabled", bg="#f59e0b", fg="#2b0500")
             # Start polling for ready file and process state
-            self.after(500, self._poll_ready)
+            self._begin_ready_poll()
         except Exception as e:
+            from tkinter import messagebox
             messagebox.showerror("Error", f"Failed to start tracker: {e}")
 
     def choose_directory(self):
         """Open a directory picker and store the chosen path."""
+        from tkinter import filedialog
         selected = filedialog.askdirectory(title="Select save directory", initialdir=ROOT_DIR)
         if selected:
             self.save_dir = selected
-            display = selected if len(selected) <= 80 else f"...{selected[-77:]}"
+            display = _shorten(selected, 80)
             self.dir_label.config(text=f"Save dir: {display}")
             # Persist selection to local config
             try:
@@ -209,103 +440,118 @@ class Launcher(tk.Tk):
                 # Non-fatal if write fails
                 pass
 
-    def _config_path(self):
-        return os.path.join(ROOT_DIR, "launcher_config.json")
-
     def _load_config(self):
-        cfg = self._config_path()
         config_modified = False
         try:
-            if os.path.exists(cfg):
-                with open(cfg, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                sd = data.get("save_dir")
-                if sd and os.path.exists(sd):
-                    self.save_dir = sd
-                    # Don't update UI here - dir_label doesn't exist yet during __init__
-
-                # Load persisted task/file paths and validate they exist
-                task_reading = data.get("task_reading", "") or ""
-                task_video = data.get("task_video", "") or ""
-                task_interactive = data.get("task_interactive", "") or ""
-                
-                # Validate task files - clear if they don't exist
-                # Skip os.path.exists check for URLs (reading task can be a URL)
-                if task_reading and not task_reading.startswith(("http://", "https://")) and not os.path.exists(task_reading):
-                    print(f"Warning: Reading task file not found: {task_reading}")
-                    task_reading = ""
-                    config_modified = True
-                
-                if task_video and not os.path.exists(task_video):
-                    print(f"Warning: Video task file not found: {task_video}")
-                    task_video = ""
-                    config_modified = True
-                
-                if task_interactive and not os.path.exists(task_interactive):
-                    print(f"Warning: Interactive task file not found: {task_interactive}")
-                    task_interactive = ""
-                    config_modified = True
-                
-                self.task_reading = task_reading
-                self.task_video = task_video
-                self.task_interactive = task_interactive
-                
-                self.sande = bool(data.get("sande", False))
-                self.osdi6 = bool(data.get("osdi6", False))
-                self.demographics = bool(data.get("demographics", True))
-                self.last_name = data.get("last_name", "") or ""
-                # Load duration with proper type conversion
-                duration_val = data.get("duration_minutes", 5)
-                try:
-                    self.duration_minutes = int(duration_val)
-                except (ValueError, TypeError):
-                    self.duration_minutes = 5
-                
-                # Save config if any files were cleared
-                if config_modified:
-                    # Use a flag to save after __init__ completes
-                    self._needs_config_save = True
-                
-                if self.last_name:
-                    self.name_var.set(self.last_name)
-                
-                print(f"[DEBUG] Config loaded - sande={self.sande}, osdi6={self.osdi6}, duration={self.duration_minutes}", file=sys.stderr)
+            # A missing config file just means first run
+            try:
+                with open(CONFIG_PATH, "rb") as f:
+                    config_text = f.read()
+            except FileNotFoundError:
+                return
+            data = _config_loads(config_text)
+            self._last_config_text = config_text
+            sd = data.get("save_dir")
+
+            # Load persisted task/file paths and validate they exist
+            task_reading = data.get("task_reading", "") or ""
+            task_video = data.get("task_video", "") or ""
+            task_interactive = data.get("task_interactive", "") or ""
+            
+            # Check all local paths in one pass (reading task can be a URL, which isn't checked)
+            local_paths = [p for p in (sd, task_video, task_interactive) if p]
+            if task_reading and not task_reading.startswith(_URL_PREFIXES):
+                local_paths.append(task_reading)
+            existing = existing_paths(local_paths)
+            
+            if sd and sd in existing:
+                self.save_dir = sd
+                # Don't update UI here - dir_label doesn't exist yet during __init__
+            
+            # Validate task files - clear if they don't exist
+            if task_reading in local_paths and task_reading not in existing:
+                print(f"Warning: Reading task file not found: {task_reading}")
+                task_reading = ""
+                config_modified = True
+            
+            if task_video and task_video not in existing:
+                print(f"Warning: Video task file not found: {task_video}")
+                task_video = ""
+                config_modified = True
+            
+            if task_interactive and task_interactive not in existing:
+                print(f"Warning: Interactive task file not found: {task_interactive}")
+                task_interactive = ""
+                config_modified = True
+            
+            self.task_reading = task_reading
+            self.task_video = task_video
+            self.task_interactive = task_interactive
+            
+            for key, default, cast in _CONFIG_SETTINGS:
+                setattr(self, key, _coerce_setting(data.get(key), default, cast))
+            
+            # Save config if any files were cleared
+            if config_modified:
+                # Use a flag to save after __init__ completes
+                self._needs_config_save = True
+            
+            if self.last_name:
+                self.name_var.set(self.last_name)
+            
+            print(f"[DEBUG] Config loaded - sande={self.sande}, osdi6={self.osdi6}, duration={self.duration_minutes}", file=sys.stderr)
         except Exception as e:
             print(f"[ERROR] Config load failed: {e}", file=sys.stderr)
 
     def _save_config(self):
-        cfg = self._config_path()
         try:
-            # Ensure duration_minutes is an integer
-            duration = self.duration_minutes
-            if not isinstance(duration, int):
-                try:
-                    duration = int(duration)
-                except (ValueError, TypeError):
-                    duration = 5
-            
             config_data = {
                 "save_dir": self.save_dir,
                 "task_reading": self.task_reading,
                 "task_video": self.task_video,
                 "task_interactive": self.task_interactive,
-                "sande": bool(self.sande),
-                "osdi6": bool(self.osdi6),
-                "demographics": bool(self.demographics),
-                "last_name": self.name_var.get().strip(),
-                "duration_minutes": duration,
             }
+            for key, default, cast in _CONFIG_SETTINGS:
+                value = self.participant_name if key == "last_name" else getattr(self, key)
+                config_data[key] = _coerce_setting(value, default, cast)
+            
+            # Skip the write entirely if nothing changed since the last save/load
+            config_text = _config_dumps(config_data)
+            if config_text == self._last_config_text:
+                return
             
             print(f"[DEBUG] Saving config - sande={config_data['sande']}, osdi6={config_data['osdi6']}, duration={config_data['duration_minutes']}", file=sys.stderr)
             
-            with open(cfg, "w", encoding="utf-8") as f:
-                json.dump(config_data, f, indent=2)
+            # Write to a temporary file and swap it in, so a crash never leaves a truncated config
+            tmp_path = CONFIG_PATH + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(config_text)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, CONFIG_PATH)
+            self._last_config_text = config_text
         except Exception as e:
             # Log the error instead of silently ignoring
             print(f"Error saving config: {e}", file=sys.stderr)
-        except Exception:
-            # bubble up to caller if needed
-            raise
+
+    # Setup changes arriving within this many ms of each other are written to disk once
+    _CONFIG_FLUSH_MS = 250
+
+    def _mark_config_dirty(self):
+        """Schedule a config save, coalescing bursts of changes (e.g. slider drags) into one write."""
+        self._cfg_dirty = True
+        if self._cfg_after_id is not None:
+            self.after_cancel(self._cfg_after_id)
+        self._cfg_after_id = self.after(self._CONFIG_FLUSH_MS, self._flush_config)
+
+    def _flush_config(self):
+        """Write any pending config changes now."""
+        if self._cfg_after_id is not None:
+            self.after_cancel(self._cfg_after_id)
+            self._cfg_after_id = None
+        if self._cfg_dirty:
+            self._cfg_dirty = False
+            self._save_config()
 
     _PREWARM_MESSAGES = [
         "Starting camera...",
@@ -330,7 +576,7 @@ class Launcher(tk.Tk):
         if not self._prewarm_active:
             return
         msg = self._PREWARM_MESSAGES[self._prewarm_index % len(self._PREWARM_MESSAGES)]
-        self.status_label.config(text=f"Status: {msg}", fg="#fef3c7")
+        self._set_status(f"Status: {msg}", "#fef3c7")
         self._prewarm_index += 1
         self._prewarm_after_id = self.after(1800, self._tick_prewarm)
 
@@ -346,55 +592,113 @@ class Launcher(tk.Tk):
         # Stop the running tracker process
         self._stop_prewarm_messages()
         if self.process is None:
-            self.status_label.config(text="Status: Idle", fg="#9ca3af")
+            self._set_status("Status: Idle", "#9ca3af")
             self.preview_btn.config(text="Preview", state="normal", bg="#3b82f6", fg="#fff")
             return
         if self.process.poll() is None:
             try:
                 self.process.terminate()
                 self.process.wait(timeout=3)
-                self.status_label.config(text="Status: Stopped", fg="#fca5a5")
+                self._set_status("Status: Stopped", "#fca5a5")
             except Exception:
                 try:
                     self.process.kill()
                 except Exception:
                     pass
-                self.status_label.config(text="Status: Stopped", fg="#fca5a5")
+                self._set_status("Status: Stopped", "#fca5a5")
         else:
-            self.status_label.config(text="Status: Idle", fg="#9ca3af")
+            self._set_status("Status: Idle", "#9ca3af")
         self.process = None
-        # Reset button
+        self._preview_open = False
+        # Reset buttons
         self.preview_btn.config(text="Preview", state="normal", bg="#3b82f6", fg="#fff")
+        self.stop_btn.config(state="disabled", bg="#6b7280", fg="#d1d5db")
+
+    # Poll quickly for the ready file while the tracker starts, then only watch for the process exiting.
+    # The ready poll interval doubles every _READY_BACKOFF_S seconds (up to _READY_POLL_MAX_MS) for a slow start.
+    _READY_POLL_MS = 100
+    _READY_POLL_MAX_MS = 1000
+    _READY_BACKOFF_S = 5
+    _EXIT_POLL_MS = 2000
+    # With the watcher running, its flag is read this often and the ready file and process are only
+    # checked every _READY_POLL_MAX_MS as a fallback
+    _READY_FLAG_POLL_MS = 50
+
+    def _begin_ready_poll(self):
+        """Start polling for the tracker's ready file (and watching for it, if watchdog is installed)."""
+        self._ready_poll_start = time.monotonic()
+        self._ready_check_due = self._ready_poll_start
+        if Observer is not None and self._ready_watcher is None:
+            try:
+                self._ready_watcher = _ReadyFileWatcher()
+            except Exception as e:
+                print(f"[DEBUG] Could not watch for the ready file, polling instead: {e}", file=sys.stderr)
+        self._ready_poll_id = self.after(self._READY_POLL_MS, self._poll_ready)
+
+    def _stop_ready_watch(self):
+        if self._ready_watcher is not None:
+            self._ready_watcher.stop()
+            self._ready_watcher = None
+
+    def _on_tracker_exit(self):
+        self._set_status("Status: Stopped", "#fca5a5")
+        self._stop_prewarm_messages()
+        self.preview_btn.config(text="Preview", state="normal", bg="#3b82f6", fg="#fff")
+        self.stop_btn.config(state="disabled", bg="#6b7280", fg="#d1d5db")
+        self.process = None
+        self._preview_open = False
+        self._watching_process = False
 
     def _poll_ready(self):
         """Poll for the ready file or process exit to update UI state."""
-        ready_path = os.path.join(ROOT_DIR, "tracker.ready")
+        self._ready_poll_id = None
+        watcher = self._ready_watcher
+        if watcher is not None and not watcher.seen.is_set() and time.monotonic() < self._ready_check_due:
+            # Nothing from the watcher yet and no fallback check due
+            self._ready_poll_id = self.after(self._READY_FLAG_POLL_MS, self._poll_ready)
+            return
         # If process exited
         if self.process is None or (self.process.poll() is not None):
-            self.status_label.config(text="Status: Stopped", fg="#fca5a5")
-            self._stop_prewarm_messages()
-            self.preview_btn.config(text="Preview", state="normal", bg="#3b82f6", fg="#fff")
-            self.process = None
+            self._stop_ready_watch()
+            self._on_tracker_exit()
             return
         # If ready file exists, the tracker is running
-        if os.path.exists(ready_path):
+        if os.path.exists(TRACKER_READY_PATH):
+            self._stop_ready_watch()
             # Add a small delay to ensure window is actually visible
-            # Check if this is the first time we're detecting ready state
-            if not hasattr(self, '_ready_confirmed') or not self._ready_confirmed:
-                self._ready_confirmed = True
-                self._ready_timestamp = self.after(1500, self._confirm_running)
-            # Continue polling to detect when process exits
-            self.after(500, self._poll_ready)
+            self.after(1500, self._confirm_running)
+            # Stop looking for the ready file; just detect when the process exits
+            if not self._watching_process:
+                self._watching_process = True
+                self.after(self._EXIT_POLL_MS, self._watch_process)
         else:
-            # Still initializing, keep polling
-            self.after(500, self._poll_ready)
+            # Still initializing, keep polling (less often the longer it takes); with the watcher
+            # running, only its flag is read until the next fallback check
+            if watcher is not None:
+                self._ready_check_due = time.monotonic() + self._READY_POLL_MAX_MS / 1000
+                interval = self._READY_FLAG_POLL_MS
+            else:
+                steps = int((time.monotonic() - self._ready_poll_start) // self._READY_BACKOFF_S)
+                interval = min(self._READY_POLL_MS << min(steps, 8), self._READY_POLL_MAX_MS)
+            self._ready_poll_id = self.after(interval, self._poll_ready)
+
+    def _watch_process(self):
+        """Detect the tracker exiting (e.g. window closed with ESC) after it became ready."""
+        if self.process is None or (self.process.poll() is not None):
+            self._on_tracker_exit()
+            return
+        # The tracker removes its ready file when its window closes, e.g. with the window's own X button
+        if self._preview_open and self._ready_poll_id is None and not os.path.exists(TRACKER_READY_PATH):
+            self._preview_open = False
+            self._show_preview_hidden()
+        self.after(self._EXIT_POLL_MS, self._watch_process)
     
     def _confirm_running(self):
         """Confirm tracker is running after delay to ensure window is visible."""
-        if self.process and self.process.poll() is None:
+        if self.process and self.process.poll() is None and self._preview_open:
             self._stop_prewarm_messages()
-            self.status_label.config(text="Status: Camera ready", fg="#86efac")
-            self.preview_btn.config(text="Stop", state="normal", bg="#ef4444", fg="#fff")
+            self._set_status("Status: Camera ready", "#86efac")
+            self.preview_btn.config(text="Hide preview", state="normal", bg="#3b82f6", fg="#fff")
             # Enable Start button now that preview has been verified
             self._preview_verified = True
             self.start_btn.config(state="normal", bg="#10b981", fg="#03241b")
@@ -402,23 +706,49 @@ class Launcher(tk.Tk):
     def toggle_preview(self):
         """Toggle preview mode - eye tracker with window for verification."""
         if self.process is None or (self.process.poll() is not None):
-            # Reset ready confirmation state
-            self._ready_confirmed = False
-            # Save last name when starting
-            try:
-                self.last_name = self.name_var.get().strip()
+            # Save last name when starting (only if it changed)
+            if self.participant_name != self.last_name:
+                self.last_name = self.participant_name
                 self._save_config()
-            except Exception:
-                pass
             self.start_tracker()
+        elif not self._preview_open:
+            # Tracker is still running in the background -> just show its window again
+            self._show_preview()
         else:
-            # currently running -> stop
-            self.preview_btn.config(text="Stopping...", state="disabled", bg="#ef4444", fg="#fff")
-            self.stop_tracker()
+            # currently previewing -> hide the window but keep the tracker warm for the experiment
+            self._hide_preview()
+
+    def _show_preview(self):
+        """Reopen the window of an already running tracker and wait for it to display."""
+        try:
+            if os.path.exists(TRACKER_READY_PATH):
+                os.remove(TRACKER_READY_PATH)
+        except Exception:
+            pass
+        self._preview_open = True
+        self._send_tracker_command("OPEN_WINDOW")
+        self.preview_btn.config(text="Initializing...", state="disabled", bg="#f59e0b", fg="#2b0500")
+        self._begin_ready_poll()
+
+    def _hide_preview(self):
+        """Close the preview window; the tracker keeps running headless so Start doesn't respawn it."""
+        self._preview_open = False
+        self._send_tracker_command("CLOSE_WINDOW")
+        self._show_preview_hidden()
+
+    def _show_preview_hidden(self):
+        """Show that the tracker is still running (camera on) without its preview window."""
+        self._set_status("Status: Camera on (preview hidden)", "#86efac")
+        self.preview_btn.config(text="Preview", state="normal", bg="#3b82f6", fg="#fff")
+
+    def stop_camera(self):
+        """Stop the tracker process, turning the camera off; Preview starts a new one."""
+        self.stop_tracker()
     
     def start_experiment(self):
         """Start the full experiment with sequential tasks."""
-        name = self.name_var.get().strip()
+        from tkinter import messagebox
+        name = self.participant_name
         if not name:
             messagebox.showwarning("Name Required", "Please enter a participant name before starting.")
             return
@@ -428,34 +758,36 @@ class Launcher(tk.Tk):
             messagebox.showwarning("No Tasks", "Please configure at least one task in Setup before starting.")
             return
         
-        # Save last name
-        try:
+        # Save last name (only if it changed)
+        if name != self.last_name:
             self.last_name = name
             self._save_config()
-        except Exception:
-            pass
         
         # Disable buttons during experiment
         self.start_btn.config(state="disabled")
         self.preview_btn.config(state="disabled")
+        self.stop_btn.config(state="disabled", bg="#6b7280", fg="#d1d5db")
         
-        # Start the experiment sequence
-        self._run_experiment_sequence()
+        # Run the experiment sequence from the event loop rather than inside the button callback,
+        # so the disabled buttons are drawn first. The sequence itself waits with wait_window and
+        # _wait_until, which keep Tk processing events between and during tasks.
+        self.after_idle(self._run_experiment_sequence)
     
     def _run_experiment_sequence(self):
         """Run the experiment tasks in sequence."""
+        from tkinter import messagebox
+        self._experiment_running = True
         try:
-            name = self.name_var.get().strip()
+            name = self.participant_name
             duration_seconds = self.duration_minutes * 60
             
             # Ensure eye tracker is running (start in headless mode if not already running)
-            self.status_label.config(text="Status: Starting eye tracker...", fg="#fbbf24")
-            self.update()
+            self._set_status("Status: Starting eye tracker...", "#fbbf24")
+            self.update_idletasks()
             
             if self.process is None or self.process.poll() is not None:
                 # Start tracker in headless mode
-                python_exe = find_python_executable()
-                cmd = [python_exe, os.path.join(ROOT_DIR, "Eye_State_Detector.py"), "--headless"]
+                cmd = [PYTHON_EXECUTABLE, TRACKER_SCRIPT, "--headless"]
                 if name:
                     cmd += ["--name", name]
                 if self.save_dir:
@@ -463,24 +795,34 @@ class Launcher(tk.Tk):
                 cmd += ["--order", self.task_order_code]
                 
                 try:
-                    self.process = subprocess.Popen(cmd, cwd=ROOT_DIR)
+                    # Remove a stale ready file left behind by a tracker that didn't exit cleanly
+                    if os.path.exists(TRACKER_READY_PATH):
+                        os.remove(TRACKER_READY_PATH)
+                    self.process = subprocess.Popen(cmd, cwd=ROOT_DIR, stdin=subprocess.PIPE)
                     print(f"[DEBUG] Started headless tracker (PID {self.process.pid})", file=sys.stderr)
-                    # Wait a moment for tracker to initialize
-                    time.sleep(2)
                 except Exception as e:
                     messagebox.showerror("Error", f"Failed to start tracker: {e}")
                     return
+                # Wait for the tracker to process its first frame (it writes the ready file) or exit
+                process = self.process
+                self._wait_until(lambda: os.path.exists(TRACKER_READY_PATH) or process.poll() is not None, timeout=30)
+                if process.poll() is not None:
+                    self.process = None
+                    messagebox.showerror("Error", "Eye tracker exited during startup.")
+                    return
             else:
                 # Tracker already running (from preview) - close window if open
+                self._preview_open = False
                 self._send_tracker_command("CLOSE_WINDOW")
-                time.sleep(0.5)
+                # Give the preview window a moment to close before the first task opens
+                self._wait_until(lambda: False, timeout=0.5)
             
             # Run each task in order
             trivia_score = None
             trivia_total = None
             for i, task_name in enumerate(self.task_order, 1):
-                self.status_label.config(text=f"Status: Task {i}/3 - {task_name}", fg="#86efac")
-                self.update()
+                self._set_status(f"Status: Task {i}/3 - {task_name}", "#86efac")
+                self.update_idletasks()
                 
                 if task_name == "Reading":
                     self._run_reading_task(name, duration_seconds)
@@ -493,10 +835,12 @@ class Launcher(tk.Tk):
             # Stop eye tracker
             self._send_tracker_command("SHUTDOWN")
             if self.process:
-                self.process.wait(timeout=3)
+                process = self.process
+                if not self._wait_until(lambda: process.poll() is not None, timeout=3):
+                    process.kill()
                 self.process = None
             
-            self.status_label.config(text="Status: Experiment Complete!", fg="#86efac")
+            self._set_status("Status: Experiment Complete!", "#86efac")
             if trivia_score is not None and trivia_total and trivia_total > 0:
                 pct = (trivia_score / trivia_total) * 100
                 score_line = f"\n\nYou got {trivia_score} of {trivia_total} ({pct:.1f}%) of the trivia questions correct!"
@@ -506,15 +850,18 @@ class Launcher(tk.Tk):
             
         except Exception as e:
             messagebox.showerror("Error", f"Error during experiment:\n{e}")
-            self.status_label.config(text="Status: Error", fg="#fca5a5")
+            self._set_status("Status: Error", "#fca5a5")
         finally:
+            self._experiment_running = False
             # Re-enable buttons
             self.start_btn.config(state="normal")
             self.preview_btn.config(state="normal")
+            if self.process is not None and self.process.poll() is None:
+                self.stop_btn.config(state="normal", bg="#ef4444", fg="#fff")
     
     def _stories_default_dir(self):
         """Return the directory where stories are (or will be) saved."""
-        if self.task_reading and not self.task_reading.startswith(("http://", "https://")):
+        if self.task_reading and not self.task_reading.startswith(_URL_PREFIXES):
             return os.path.dirname(os.path.abspath(self.task_reading))
         return os.path.join(self.save_dir or ROOT_DIR, "stories")
 
@@ -536,13 +883,13 @@ class Launcher(tk.Tk):
         dlg.transient(parent_win)
         dlg.grab_set()
 
-        lf = font.Font(family="Segoe UI", size=10)
+        lf = self.dialog_font
 
         # URL row
         url_frame = tk.Frame(dlg, bg="#111827")
         url_frame.pack(fill="x", padx=16, pady=(16, 6))
         tk.Label(url_frame, text="Start URL:", bg="#111827", fg="#e5e7eb", font=lf, width=12, anchor="w").pack(side="left")
-        default_url = self.task_reading if self.task_reading.startswith("http") else "https://read.gov/aesop/002.html"
+        default_url = self.task_reading if self.task_reading.startswith(_URL_PREFIXES) else "https://read.gov/aesop/002.html"
         url_var = tk.StringVar(value=default_url)
         tk.Entry(url_frame, textvariable=url_var, width=42, font=lf).pack(side="left", padx=(6, 0))
 
@@ -568,6 +915,7 @@ class Launcher(tk.Tk):
         out_entry = tk.Entry(dir_frame, textvariable=out_var, width=32, font=lf, state="readonly")
         out_entry.pack(side="left", padx=(6, 6))
         def _choose_out():
+            from tkinter import filedialog
             sel = filedialog.askdirectory(title="Save stories to", initialdir=self.save_dir or ROOT_DIR)
             if sel:
                 out_var.set(os.path.join(sel, "stories"))
@@ -612,8 +960,9 @@ class Launcher(tk.Tk):
                     paths = download_stories(start_url, count, out_dir, progress_callback=_progress)
                     if paths:
                         first = paths[0]
-                        getter(first)
-                        short = first if len(first) <= 60 else f"...{first[-57:]}"
+                        # Setting the task schedules a config flush, which must happen on the Tk thread
+                        dlg.after(0, lambda: getter(first))
+                        short = _shorten(first)
                         dlg.after(0, lambda: fname_var.set(short))
                         n = len(paths)
                         dlg.after(0, lambda: prog_var.set(f"Downloaded {n} stories. Reading task updated."))
@@ -644,7 +993,7 @@ class Launcher(tk.Tk):
         
         win = QuestionnaireWindow(
             self,
-            participant_name=self.name_var.get().strip(),
+            participant_name=self.participant_name,
             order_code=self.task_order_code,
             save_dir=self.save_dir or ROOT_DIR
         )
@@ -655,6 +1004,7 @@ class Launcher(tk.Tk):
         if not self.task_reading:
             return
         
+        from tkinter import messagebox
         from reading_window import show_reading_window
         
         # Generate filename for this task
@@ -663,7 +1013,7 @@ class Launcher(tk.Tk):
         def on_ready():
             """Called when reading window is loaded and ready"""
             print(f"[DEBUG] Reading task ready - starting recording to {csv_filename}", file=sys.stderr)
-            self._send_tracker_command(f"START_RECORDING {csv_filename}")
+            self._start_recording(csv_filename)
         
         try:
             # Launch reading window - this will block until window closes
@@ -695,7 +1045,7 @@ class Launcher(tk.Tk):
         def on_ready():
             """Called when video is loaded and ready"""
             print(f"[DEBUG] Video task ready - starting recording to {csv_filename}", file=sys.stderr)
-            self._send_tracker_command(f"START_RECORDING {csv_filename}")
+            self._start_recording(csv_filename)
         
         player = VideoPlayerWindow(
             self,
@@ -725,7 +1075,7 @@ class Launcher(tk.Tk):
         def on_ready():
             """Called when interactive window is fully loaded"""
             print(f"[DEBUG] Interactive task ready - starting recording to {csv_filename}", file=sys.stderr)
-            self._send_tracker_command(f"START_RECORDING {csv_filename}")
+            self._start_recording(csv_filename)
         
         interactive = InteractiveTaskWindow(
             self,
@@ -748,15 +1098,68 @@ class Launcher(tk.Tk):
 
 
     def on_close(self):
+        # Write any Setup changes still waiting for the debounce timer
+        self._flush_config()
         # Stop child process if running
         if self.process is not None and self.process.poll() is None:
-            if messagebox.askyesno("Quit", "Tracker is running. Stop it and quit?"):
+            # Only an idle, hidden warm tracker is stopped without asking; during an experiment
+            # (possibly recording) or while the preview is showing, confirm first
+            from tkinter import messagebox
+            idle_warm = not self._preview_open and not self._experiment_running
+            if idle_warm or messagebox.askyesno("Quit", "Tracker is running. Stop it and quit?"):
                 self.stop_tracker()
             else:
                 return
+        # Stop (and join) the ready-file observer before the Tk root goes away
+        self._stop_ready_watch()
         self.destroy()
 
     # --- Setup window implementation -------------------------------------------------
+    def _show_tooltip(self, text, x, y):
+        """Show the full-path tooltip at screen position (x, y).
+
+        A single tooltip window is created on first use and then only shown and hidden,
+        so it is shared by every Setup window rather than rebuilt on each hover.
+        """
+        if not text:
+            return
+        if self._tooltip is None:
+            self._tooltip = tk.Toplevel(self)
+            self._tooltip.withdraw()
+            self._tooltip.wm_overrideredirect(True)
+            self._tooltip_var = tk.StringVar(self)
+            tk.Label(self._tooltip, textvariable=self._tooltip_var, bg="#111827", fg="#e5e7eb", bd=1, relief="solid", font=("Segoe UI", 9)).pack(ipadx=6, ipady=4)
+        self._tooltip_var.set(text)
+        self._tooltip.wm_geometry(f"+{x}+{y}")
+        self._tooltip.deiconify()
+        self._tooltip.lift()
+
+    def _hide_tooltip(self):
+        if self._tooltip is not None:
+            self._tooltip.withdraw()
+
+    def _add_tooltip(self, widget, text_getter):
+        """Show a tooltip with text_getter() while the pointer is over widget."""
+        widget._tooltip_text = text_getter
+        widget.bindtags(("TooltipLabel",) + widget.bindtags())
+
+    def _on_tooltip_enter(self, event):
+        # position near the mouse cursor
+        self._show_tooltip(event.widget._tooltip_text(), event.x_root + 16, event.y_root + 10)
+
+    def _on_tooltip_leave(self, event):
+        self._hide_tooltip()
+
+    def _set_task(self, attr, path=None, get=False):
+        """Getter/setter for a task file attribute (a URL is fine for the reading task).
+
+        With get=True, return the current value; otherwise store path and persist it.
+        """
+        if get:
+            return getattr(self, attr)
+        setattr(self, attr, path or "")
+        self._mark_config_dirty()
+
     def open_setup_window(self):
         win = tk.Toplevel(self)
         win.title("Setup — Task files and options")
@@ -781,7 +1184,7 @@ class Launcher(tk.Tk):
             # best-effort centering; ignore if window metrics aren't available
             pass
 
-        label_font = font.Font(family="Segoe UI", size=10)
+        label_font = self.dialog_font
 
         rowpad = dict(pady=8, padx=12)
 
@@ -790,60 +1193,33 @@ class Launcher(tk.Tk):
             frame = tk.Frame(parent, bg="#111827")
             frame.pack(fill="x", **rowpad)
             lbl = tk.Label(frame, text=title + ":", bg="#111827", fg="#e5e7eb", font=label_font, width=14, anchor="w")
-            lbl.pack(side="left")
+            lbl.grid(row=0, column=0, sticky="w")
 
             def choose_file():
+                from tkinter import filedialog
                 path = filedialog.askopenfilename(title=f"Choose {title}", initialdir=ROOT_DIR, filetypes=filetypes)
                 if path:
                     # Update backing storage and persist
                     getter(path)
                     # Update the visible filename to the right of the button
-                    shortp = path if len(path) <= 60 else f"...{path[-57:]}"
+                    shortp = _shorten(path)
                     fname_var.set(shortp)
 
             btn = tk.Button(frame, text="Choose file...", command=choose_file, bg="#374151", fg="#fff", relief="flat", padx=8)
-            btn.pack(side="left", padx=(6, 8))
+            btn.grid(row=0, column=1, padx=(6, 8))
 
             fname_var = tk.StringVar()
             fname = getter(None, get=True)
             if fname:
-                short = fname if len(fname) <= 60 else f"...{fname[-57:]}"
+                short = _shorten(fname)
                 fname_var.set(short)
             lbl_name = tk.Label(frame, textvariable=fname_var, bg="#111827", fg="#9ca3af", font=label_font, anchor="w", justify="left")
-            lbl_name.pack(side="left", fill="x", expand=True)
-
-            # Lightweight tooltip that shows the full path on hover. It queries the getter each time
-            # so the tooltip text stays in sync when the selection changes.
-            tooltip = {'win': None}
+            lbl_name.grid(row=0, column=2, sticky="ew")
+            # The filename column takes the spare width, as pack's expand=True did
+            frame.grid_columnconfigure(2, weight=1)
 
-            def show_tooltip(event):
-                try:
-                    full = getter(None, get=True) or ""
-                    if not full:
-                        return
-                    # create a small toplevel without decorations
-                    t = tk.Toplevel(self)
-                    t.wm_overrideredirect(True)
-                    lbl = tk.Label(t, text=full, bg="#111827", fg="#e5e7eb", bd=1, relief="solid", font=("Segoe UI", 9))
-                    lbl.pack(ipadx=6, ipady=4)
-                    # position near the mouse cursor
-                    x = event.x_root + 16
-                    y = event.y_root + 10
-                    t.wm_geometry(f"+{x}+{y}")
-                    tooltip['win'] = t
-                except Exception:
-                    pass
-
-            def hide_tooltip(event):
-                try:
-                    if tooltip['win'] is not None:
-                        tooltip['win'].destroy()
-                        tooltip['win'] = None
-                except Exception:
-                    pass
-
-            lbl_name.bind("<Enter>", show_tooltip)
-            lbl_name.bind("<Leave>", hide_tooltip)
+            # Tooltip shows the full path; it queries the getter so it stays in sync when the selection changes
+            self._add_tooltip(lbl_name, functools.partial(getter, None, get=True))
             
             # If this is the interactive task, add SANDE/OSDI checkboxes below
             if is_interactive:
@@ -863,15 +1239,15 @@ class Launcher(tk.Tk):
 
                 def on_demographics():
                     self.demographics = bool(demographics_var.get())
-                    self._save_config()
+                    self._mark_config_dirty()
 
                 def on_sande():
                     self.sande = bool(sande_var.get())
-                    self._save_config()
+                    self._mark_config_dirty()
 
                 def on_osdi():
                     self.osdi6 = bool(osdi_var.get())
-                    self._save_config()
+                    self._mark_config_dirty()
 
                 cb0 = tk.Checkbutton(opts_frame, text="Demographics", variable=demographics_var, command=on_demographics, bg="#111827", fg="#e5e7eb", selectcolor="#111827")
                 cb0.pack(side="left", padx=(0, 12))
@@ -900,44 +1276,11 @@ class Launcher(tk.Tk):
 
             return fname_var
 
-        # Setters/getters that update state and persist
-        def set_reading(path=None, get=False):
-            if get:
-                return self.task_reading
-            # If path looks like a URL, treat as URL
-            if path and (path.startswith("http://") or path.startswith("https://")):
-                self.task_reading = path
-            else:
-                self.task_reading = path or ""
-            self._save_config()
-
-        def set_video(path=None, get=False):
-            if get:
-                return self.task_video
-            self.task_video = path or ""
-            self._save_config()
-
-        def set_interactive(path=None, get=False):
-            if get:
-                return self.task_interactive
-            self.task_interactive = path or ""
-            self._save_config()
-
         # Create task mapping for reordering based on task_order
         task_map = {
-            "Reading": ("Reading task (URL or file)", set_reading, [
-                ("Webpage URL", "*.url"),
-                ("Text files", "*.txt *.pdf"),
-                ("All files", "*.*")
-            ]),
-            "Video": ("Video task", set_video, [
-                ("Video files", "*.mp4 *.avi *.mov *.mkv *.wmv *.flv *.webm *.m4v *.mpeg *.mpg"),
-                ("All files", "*.*")
-            ]),
-            "Interactive": ("Interactive task", set_interactive, [
-                ("JSON files", "*.json"),
-                ("All files", "*.*")
-            ]),
+            "Reading": ("Reading task (URL or file)", functools.partial(self._set_task, "task_reading"), _READING_FILETYPES),
+            "Video": ("Video task", functools.partial(self._set_task, "task_video"), _VIDEO_FILETYPES),
+            "Interactive": ("Interactive task", functools.partial(self._set_task, "task_interactive"), _INTERACTIVE_FILETYPES),
         }
         
         # Add row for task order selection
@@ -948,8 +1291,7 @@ class Launcher(tk.Tk):
         # Build option list: all 6 orders, mark the auto-calculated one
         auto_num = self._calculate_task_order()
         order_options = []
-        for num, tasks in TASK_ORDERS.items():
-            code = get_order_code(tasks)
+        for num, code in TASK_ORDER_CODES.items():
             label = f"{code}  [auto]" if num == auto_num else code
             order_options.append((num, label))
         order_labels = [lbl for _, lbl in order_options]
@@ -968,9 +1310,10 @@ class Launcher(tk.Tk):
             self.task_order_override = new_num
             self.task_order_num = new_num
             self.task_order = TASK_ORDERS[new_num]
-            self.task_order_code = get_order_code(self.task_order)
+            self.task_order_code = TASK_ORDER_CODES[new_num]
             self.order_label.config(text=f"Task Order: {self.task_order_code}")
             # Rebuild the task rows to reflect new order - close and reopen setup
+            self._flush_config()
             win.destroy()
             self.after(50, self.open_setup_window)
 
@@ -1001,9 +1344,11 @@ class Launcher(tk.Tk):
         
         def on_duration_change(val):
             minutes = int(float(val))
+            if minutes == self.duration_minutes:
+                return
             duration_value_lbl.config(text=f"{minutes} min")
             self.duration_minutes = minutes
-            self._save_config()
+            self._mark_config_dirty()
         
         duration_slider = tk.Scale(
             duration_frame,
@@ -1030,19 +1375,20 @@ class Launcher(tk.Tk):
         save_lbl.pack(side="left")
         
         def choose_save_dir():
+            from tkinter import filedialog
             selected = filedialog.askdirectory(title="Select save directory", initialdir=ROOT_DIR)
-            if selected:
+            if selected and selected != self.save_dir:
                 self.save_dir = selected
-                display = selected if len(selected) <= 50 else f"...{selected[-47:]}"
+                display = _shorten(selected, 50)
                 save_dir_var.set(display)
-                self._save_config()
+                self._mark_config_dirty()
         
         save_btn = tk.Button(save_frame, text="Choose directory...", command=choose_save_dir, bg="#374151", fg="#fff", relief="flat", padx=8)
         save_btn.pack(side="left", padx=(6, 8))
         
         save_dir_var = tk.StringVar()
         if self.save_dir:
-            display = self.save_dir if len(self.save_dir) <= 50 else f"...{self.save_dir[-47:]}"
+            display = _shorten(self.save_dir, 50)
             save_dir_var.set(display)
         else:
             save_dir_var.set("(not set)")
@@ -1051,39 +1397,16 @@ class Launcher(tk.Tk):
         save_dir_label.pack(side="left", fill="x", expand=True)
         
         # Tooltip for save directory
-        save_tooltip = {'win': None}
-        
-        def show_save_tooltip(event):
-            try:
-                if not self.save_dir:
-                    return
-                t = tk.Toplevel(self)
-                t.wm_overrideredirect(True)
-                lbl = tk.Label(t, text=self.save_dir, bg="#111827", fg="#e5e7eb", bd=1, relief="solid", font=("Segoe UI", 9))
-                lbl.pack(ipadx=6, ipady=4)
-                x = event.x_root + 16
-                y = event.y_root + 10
-                t.wm_geometry(f"+{x}+{y}")
-                save_tooltip['win'] = t
-            except Exception:
-                pass
-        
-        def hide_save_tooltip(event):
-            try:
-                if save_tooltip['win'] is not None:
-                    save_tooltip['win'].destroy()
-                    save_tooltip['win'] = None
-            except Exception:
-                pass
-        
-        save_dir_label.bind("<Enter>", show_save_tooltip)
-        save_dir_label.bind("<Leave>", hide_save_tooltip)
+        self._add_tooltip(save_dir_label, functools.partial(getattr, self, "save_dir"))
 
         # Done button
         def on_done():
             # Ensure all settings are saved before closing
-            self._save_config()
+            self._flush_config()
+            self._hide_tooltip()
             win.destroy()
+
+        win.protocol("WM_DELETE_WINDOW", on_done)
         
         done_frame = tk.Frame(win, bg="#111827")
         done_frame.pack(fill="x", pady=(8, 10))
@@ -4,13 +4,132 @@ Implements SANDE and OSDI-6 questionnaires for interactive task
 Also includes trivia MCQ presentation
 """
 
+import csv
+import io
 import json
 import os
 import random
+import textwrap
 import time
+from collections import namedtuple
+from functools import partial
 import tkinter as tk
-from tkinter import font, messagebox
-from datetime import datetime
+from tkinter import messagebox
+
+
+# Fallback output folders when no save directory is given
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+_DEFAULT_QUESTIONNAIRE_DIR = os.path.join(_MODULE_DIR, "questionnaires")
+_DEFAULT_TRIVIA_DIR = os.path.join(_MODULE_DIR, "trivia")
+
+# Text for each SANDE slider value (0-100)
+_SANDE_LABELS = tuple(map(str, range(101)))
+
+# Line widths (in characters) for pre-wrapping static label text, roughly matching the
+# pixel widths the labels used to wrap at with Tk's wraplength
+_SANDE_QUESTION_WRAP = 120  # ~1000 px at 11 pt
+_OSDI_HEADER_WRAP = 150  # ~1100 px at 10 pt
+_OSDI_QUESTION_WRAP = 55  # ~450 px at 11 pt
+_TRIVIA_QUESTION_WRAP = 90  # ~1000 px at 14 pt bold
+_TRIVIA_CHOICE_WRAP = 120  # ~1000 px at 11 pt
+
+# Font descriptions for labels whose font never changes. Tk resolves a tuple on use
+# without registering a named font, so nothing is allocated per window.
+TITLE_FONT = ("Segoe UI", 14, "bold")
+LABEL_FONT = ("Segoe UI", 11)
+HEADING_FONT = ("Segoe UI", 11, "bold")
+SMALL_FONT = ("Segoe UI", 9)
+LARGE_FONT = ("Segoe UI", 16, "bold")
+
+# Countdown text under the progress bar, filled with (minutes, seconds)
+_TIME_REMAINING_FMT = "Time remaining: %d:%02d"
+
+# OSDI-6 response options (label, score), left to right as on the official form
+_OSDI_OPTIONS = (
+    ("Constantly", 4),
+    ("Mostly", 3),
+    ("Often", 2),
+    ("Sometimes", 1),
+    ("Never", 0),
+)
+
+# One answered trivia question. TriviaMCQWindow's field names double as its CSV header.
+TriviaResponse = namedtuple(
+    "TriviaResponse",
+    "question_id question user_answer_position correct_answer_position original_correct_index is_correct timestamp"
+)
+InteractiveTriviaResponse = namedtuple(
+    "InteractiveTriviaResponse",
+    "question_number question selected_answer correct_answer is_correct elapsed_ms"
+)
+
+
+class VASCanvas(tk.Canvas):
+    """
+    Visual analogue scale drawn on a canvas: a track with a thumb that jumps to a click
+    and follows a drag. The value (0-100) is kept in variable, and command(value) is
+    called whenever it changes.
+    """
+    
+    THUMB_RADIUS = 10
+    TRACK_HEIGHT = 15
+    
+    def __init__(self, master, variable, command=None, height=30, **kwargs):
+        super().__init__(master, height=height, bg="#1f2937", highlightthickness=0, **kwargs)
+        self.variable = variable
+        self.command = command
+        self._track = self.create_rectangle(0, 0, 0, 0, fill="#374151", outline="")
+        self._thumb = self.create_oval(0, 0, 0, 0, fill="#e5e7eb", outline="")
+        self.bind("<Configure>", self._layout)
+        self.bind("<Button-1>", self._on_pointer)
+        self.bind("<B1-Motion>", self._on_pointer)
+    
+    def _layout(self, event=None):
+        """Stretch the track across the canvas and put the thumb at the current value"""
+        r = self.THUMB_RADIUS
+        mid = self.winfo_height() / 2
+        self.coords(self._track, r, mid - self.TRACK_HEIGHT / 2, self.winfo_width() - r, mid + self.TRACK_HEIGHT / 2)
+        self._place_thumb()
+    
+    def _place_thumb(self):
+        r = self.THUMB_RADIUS
+        mid = self.winfo_height() / 2
+        x = r + (self.winfo_width() - 2 * r) * self.variable.get() / 100
+        self.coords(self._thumb, x - r, mid - r, x + r, mid + r)
+    
+    def _on_pointer(self, event):
+        """Move the value to the pointer position (clamped to the track)"""
+        track_width = self.winfo_width() - 2 * self.THUMB_RADIUS
+        if track_width <= 0:
+            return
+        value = round(min(100, max(0, (event.x - self.THUMB_RADIUS) / track_width * 100)))
+        if value == self.variable.get():
+            return
+        self.variable.set(value)
+        self._place_thumb()
+        if self.command is not None:
+            self.command(value)
+
+
+class ProgressCanvas(tk.Canvas):
+    """
+    Countdown bar drawn on a canvas: a filled rectangle whose width follows ratio (0-1).
+    Updates move the rectangle with coords() instead of re-placing a frame.
+    """
+    
+    def __init__(self, master, height=30, **kwargs):
+        super().__init__(master, height=height, bg="#374151", highlightthickness=0, **kwargs)
+        self.ratio = 1.0
+        self._bar = self.create_rectangle(0, 0, 0, 0, fill="#10b981", outline="")
+        self.bind("<Configure>", self._layout)
+    
+    def _layout(self, event=None):
+        """Size the filled part to the current ratio of the canvas width"""
+        self.coords(self._bar, 0, 0, self.winfo_width() * self.ratio, self.winfo_height())
+    
+    def set_ratio(self, ratio):
+        self.ratio = ratio
+        self._layout()
 
 
 class QuestionnaireWindow(tk.Toplevel):
@@ -19,6 +138,10 @@ class QuestionnaireWindow(tk.Toplevel):
     Transitions between questionnaires without closing the window.
     """
     
+    # Option styles for the selected and unselected OSDI answers
+    _OSDI_SELECTED = {"bg": "#10b981", "fg": "#03241b", "font": ("Segoe UI", 9, "bold"), "borderwidth": 3}
+    _OSDI_UNSELECTED = {"bg": "#374151", "fg": "#e5e7eb", "font": ("Segoe UI", 9), "borderwidth": 2}
+    
     def __init__(self, parent, participant_name="", order_code="", save_dir=""):
         super().__init__(parent)
         
@@ -32,17 +155,18 @@ class QuestionnaireWindow(tk.Toplevel):
         self.sande_responses = {}
         self.osdi_responses = {}
         self.osdi_buttons = {}  # Store button references for styling
+        self._pending_label_updates = {}  # SANDE value label -> after_idle id of its pending refresh
         
         self.title("Dry Eye Questionnaire")
+        self.resizable(False, False)  # Fixed 1400x800 layout; no resize re-layout
         self.configure(bg="#1f2937")
         
         # Fonts
-        self.title_font = font.Font(family="Segoe UI", size=14, weight="bold")
-        self.label_font = font.Font(family="Segoe UI", size=11)
-        self.small_font = font.Font(family="Segoe UI", size=9)
+        self.title_font = TITLE_FONT
+        self.label_font = LABEL_FONT
+        self.small_font = SMALL_FONT
         
         # Size and center window - consistent 1400x800
-        self.geometry("1400x800")
         screen_w = self.winfo_screenwidth()
         screen_h = self.winfo_screenheight()
         x = (screen_w - 1400) // 2
@@ -53,26 +177,27 @@ class QuestionnaireWindow(tk.Toplevel):
         self.content_container = tk.Frame(self, bg="#1f2937")
         self.content_container.pack(expand=True, fill="both")
         
-        # Build initial UI (SANDE)
+        # Build both pages once; navigation only swaps which one is packed
+        self.sande_frame = self._build_sande()
+        self.osdi_frame = self._build_osdi()
+        
+        # Show initial page (SANDE)
         self._show_sande()
         
         # Prevent closing without completing
         self.protocol("WM_DELETE_WINDOW", self.on_close_attempt)
     
-    def _clear_content(self):
-        """Clear the current content"""
-        for widget in self.content_container.winfo_children():
-            widget.destroy()
-    
     def _show_sande(self):
         """Show SANDE questionnaire"""
         self.current_questionnaire = "SANDE"
         self.title("SANDE Dry Eye Questionnaire")
-        self._clear_content()
-        
+        self.osdi_frame.pack_forget()
+        self.sande_frame.pack(expand=True, fill="both")
+    
+    def _build_sande(self):
+        """Build the SANDE page (not yet shown) and return its container frame"""
         # Container frame to center all content
         container = tk.Frame(self.content_container, bg="#1f2937")
-        container.pack(expand=True, fill="both")
         
         # Content frame (centered within container)
         content = tk.Frame(container, bg="#1f2937")
@@ -134,6 +259,8 @@ class QuestionnaireWindow(tk.Toplevel):
             relief="flat"
         )
         submit_btn.pack()
+        
+        return container
     
     def _add_sande_question(self, parent, question_num, question_text, left_label, right_label, var_name):
         """Add a SANDE question with a visual analog scale"""
@@ -145,11 +272,10 @@ class QuestionnaireWindow(tk.Toplevel):
         # Question text
         q_label = tk.Label(
             q_frame,
-            text=f"{question_num}. {question_text}",
+            text=textwrap.fill(f"{question_num}. {question_text}", _SANDE_QUESTION_WRAP),
             bg="#1f2937",
             fg="#e5e7eb",
             font=self.label_font,
-            wraplength=1000,
             justify="left"
         )
         q_label.pack(anchor="w", pady=(0, 15))
@@ -181,39 +307,10 @@ class QuestionnaireWindow(tk.Toplevel):
         slider_frame = tk.Frame(slider_container, bg="#1f2937")
         slider_frame.pack(side="left", fill="x", expand=True)
         
-        # Create the slider
-        slider = tk.Scale(
-            slider_frame,
-            from_=0,
-            to=100,
-            orient="horizontal",
-            variable=var,
-            showvalue=False,
-            bg="#374151",
-            fg="#e5e7eb",
-            troughcolor="#1f2937",
-            highlightthickness=0,
-            sliderlength=20,
-            width=15
-        )
+        # Create the slider (jumps to the click position instead of moving incrementally)
+        slider = VASCanvas(slider_frame, variable=var)
         slider.pack(fill="x", expand=True)
         
-        # Make slider jump to click position instead of moving incrementally
-        def on_slider_click(event):
-            # Calculate position as percentage of slider width
-            slider_width = slider.winfo_width()
-            click_pos = event.x
-            # Clamp to valid range
-            if click_pos < 0:
-                click_pos = 0
-            elif click_pos > slider_width:
-                click_pos = slider_width
-            # Convert to value (0-100)
-            value = (click_pos / slider_width) * 100
-            var.set(value)
-        
-        slider.bind("<Button-1>", on_slider_click)
-        
         # Right label
         right_lbl = tk.Label(
             slider_container,
@@ -229,19 +326,28 @@ class QuestionnaireWindow(tk.Toplevel):
         # Value display below slider
         value_label = tk.Label(
             q_frame,
-            text=f"{int(var.get())}",
+            text=_SANDE_LABELS[int(var.get())],
             bg="#1f2937",
             fg="#fbbf24",
             font=self.small_font
         )
         value_label.pack(anchor="center", pady=(5, 0))
         
-        # Update value display when slider moves
-        def update_value(*args):
-            value_label.config(text=f"{int(var.get())}")
-        
-        var.trace("w", update_value)
-        update_value()
+        # Update value display when slider moves, at most once per idle cycle while dragging
+        slider.command = lambda value: self._schedule_label_update(value_label, var)
+    
+    def _schedule_label_update(self, value_label, var):
+        """Refresh value_label from var once the pending slider events have been handled"""
+        key = str(value_label)
+        if key not in self._pending_label_updates:
+            self._pending_label_updates[key] = self.after_idle(self._flush_label, key, value_label, var)
+    
+    def _flush_label(self, key, value_label, var):
+        """Show the current slider value in value_label"""
+        del self._pending_label_updates[key]
+        # The label is gone if the window was closed since the update was scheduled
+        if value_label.winfo_exists():
+            value_label.config(text=_SANDE_LABELS[int(var.get())])
     
     def _sande_next(self):
         """Move from SANDE to OSDI"""
@@ -251,11 +357,13 @@ class QuestionnaireWindow(tk.Toplevel):
         """Show OSDI-6 questionnaire"""
         self.current_questionnaire = "OSDI"
         self.title("OSDI-6 Dry Eye Questionnaire")
-        self._clear_content()
-        
+        self.sande_frame.pack_forget()
+        self.osdi_frame.pack(expand=True, fill="both")
+    
+    def _build_osdi(self):
+        """Build the OSDI-6 page (not yet shown) and return its container frame"""
         # Container frame to center all content
         container = tk.Frame(self.content_container, bg="#1f2937")
-        container.pack(expand=True, fill="both")
         
         # Content frame (centered within container)
         content = tk.Frame(container, bg="#1f2937")
@@ -342,6 +450,9 @@ class QuestionnaireWindow(tk.Toplevel):
             var_name="q6"
         )
         
+        # Answer variables in question order, for validation and saving
+        self._osdi_vars = [self.osdi_responses[f"q{i}"] for i in range(1, 7)]
+        
         # Button frame with Back and Submit
         btn_frame = tk.Frame(content, bg="#1f2937")
         btn_frame.pack(pady=(20, 20))
@@ -371,6 +482,8 @@ class QuestionnaireWindow(tk.Toplevel):
             relief="flat"
         )
         submit_btn.pack(side="left")
+        
+        return container
     
     def _add_osdi_section_header(self, parent, header_text):
         """Add a section header for OSDI question groups"""
@@ -379,11 +492,10 @@ class QuestionnaireWindow(tk.Toplevel):
         
         header_label = tk.Label(
             header_frame,
-            text=header_text,
+            text=textwrap.fill(header_text, _OSDI_HEADER_WRAP),
             bg="#1f2937",
             fg="#fbbf24",
             font=("Segoe UI", 10, "italic"),
-            wraplength=1100,
             justify="left"
         )
         header_label.pack(anchor="w")
@@ -391,37 +503,23 @@ class QuestionnaireWindow(tk.Toplevel):
     def _add_osdi_question(self, parent, question_num, question_text, var_name):
         """Add an OSDI multiple choice question with compact horizontal layout"""
         
-        # Question frame - horizontal layout
+        # Question frame - one grid row: question text, then the five options
         q_frame = tk.Frame(parent, bg="#1f2937")
         q_frame.pack(fill="x", pady=(0, 12), padx=20)
         
         # Question text on the left with FIXED WIDTH for alignment
         q_label = tk.Label(
             q_frame,
-            text=f"{question_num}. {question_text}",
+            text=textwrap.fill(f"{question_num}. {question_text}", _OSDI_QUESTION_WRAP),
             bg="#1f2937",
             fg="#e5e7eb",
             font=self.label_font,
-            wraplength=450,  # Allow text to wrap
             justify="left",
             anchor="w",
             width=50  # Fixed width in characters to ensure alignment
         )
-        q_label.pack(side="left", padx=(0, 20))
-        
-        # Options frame on the right
-        options_frame = tk.Frame(q_frame, bg="#1f2937")
-        options_frame.pack(side="left", fill="x", expand=False)  # Don't expand to maintain alignment
-        
-        # Response options - CORRECT ORDER from image headers (left to right)
-        # Constantly(4), Mostly(3), Often(2), Sometimes(1), Never(0)
-        options = [
-            ("Constantly", 4),
-            ("Mostly", 3),
-            ("Often", 2),
-            ("Sometimes", 1),
-            ("Never", 0)
-        ]
+        q_label.grid(row=0, column=0, sticky="w", padx=(0, 20))
+        q_frame.grid_columnconfigure(0, weight=1)
         
         if var_name not in self.osdi_responses:
             var = tk.IntVar(value=-1)  # -1 means not answered
@@ -433,61 +531,41 @@ class QuestionnaireWindow(tk.Toplevel):
         button_key = f"{var_name}_buttons"
         self.osdi_buttons[button_key] = []
         
-        # Create button-style radio options for better touch targets
-        for text, value in options:
-            # Container frame for each option
-            option_container = tk.Frame(
-                options_frame,
-                bg="#374151",
-                relief="solid",
-                borderwidth=2,
-                highlightthickness=0
-            )
-            option_container.pack(side="left", padx=4, ipadx=12, ipady=8)
-            
-            # Make selection callback
-            def make_osdi_select(v, val, btn_key):
-                return lambda event=None: self._select_osdi_option(v, val, btn_key)
-            
+        # Create button-style radio options for better touch targets: one bordered label per
+        # option, padded to the size the old frame + label pair had, in the columns right of the question
+        for column, (text, value) in enumerate(_OSDI_OPTIONS, 1):
             option_label = tk.Label(
-                option_container,
+                q_frame,
                 text=text,
-                bg="#374151",
-                fg="#e5e7eb",
-                font=self.small_font,
+                relief="solid",
+                highlightthickness=0,
                 cursor="hand2",
-                padx=8,
-                pady=6
+                padx=20,
+                pady=14,
+                **self._OSDI_UNSELECTED
             )
-            option_label.pack()
-            
-            # Make entire container clickable
-            callback = make_osdi_select(var, value, button_key)
-            option_container.bind("<Button-1>", callback)
-            option_label.bind("<Button-1>", callback)
+            option_label.grid(row=0, column=column, padx=4)
+            option_label.bind("<Button-1>", partial(self._select_osdi_option, var, value, button_key))
             
             # Store for styling updates
-            self.osdi_buttons[button_key].append((option_container, option_label, value))
-        
-        # Apply initial styling if already selected
-        if var.get() != -1:
-            self._select_osdi_option(var, var.get(), button_key)
+            self.osdi_buttons[button_key].append((option_label, value))
     
-    def _select_osdi_option(self, var, value, button_key):
+    def _select_osdi_option(self, var, value, button_key, event=None):
         """Handle OSDI option selection with visual feedback"""
+        previous = var.get()
+        if previous == value:
+            return  # Same option tapped again; nothing to restyle
         var.set(value)
         
-        # Update visual styling for all options in this question
+        # Restyle only the previously selected option and the new one
         if button_key in self.osdi_buttons:
-            for container, label, option_value in self.osdi_buttons[button_key]:
+            for label, option_value in self.osdi_buttons[button_key]:
                 if option_value == value:
                     # Selected style - bright highlight
-                    container.config(bg="#10b981", borderwidth=3)
-                    label.config(bg="#10b981", fg="#03241b", font=("Segoe UI", 9, "bold"))
-                else:
+                    label.config(**self._OSDI_SELECTED)
+                elif option_value == previous:
                     # Unselected style - default
-                    container.config(bg="#374151", borderwidth=2)
-                    label.config(bg="#374151", fg="#e5e7eb", font=("Segoe UI", 9))
+                    label.config(**self._OSDI_UNSELECTED)
     
     def _osdi_back(self):
         """Go back to SANDE questionnaire"""
@@ -496,13 +574,9 @@ class QuestionnaireWindow(tk.Toplevel):
     def _osdi_submit(self):
         """Validate and save both questionnaires"""
         
-        # Check all OSDI questions answered
-        unanswered = []
-        for i in range(1, 7):
-            if self.osdi_responses[f"q{i}"].get() == -1:
-                unanswered.append(i)
-        
-        if unanswered:
+        # Check all OSDI questions answered; only list the gaps when there are some
+        if any(var.get() == -1 for var in self._osdi_vars):
+            unanswered = [i for i, var in enumerate(self._osdi_vars, 1) if var.get() == -1]
             messagebox.showwarning(
                 "Incomplete",
                 f"Please answer all questions.\n\nUnanswered: {', '.join(map(str, unanswered))}",
@@ -523,35 +597,30 @@ class QuestionnaireWindow(tk.Toplevel):
         if self.save_dir:
             questionnaire_dir = os.path.join(self.save_dir, "questionnaires")
         else:
-            questionnaire_dir = os.path.join(os.path.dirname(__file__), "questionnaires")
+            questionnaire_dir = _DEFAULT_QUESTIONNAIRE_DIR
         
         os.makedirs(questionnaire_dir, exist_ok=True)
         
         # Generate filename
-        timestamp_str = datetime.now().strftime("%Y%m%dT%H%M")
+        timestamp_str = time.strftime("%Y%m%dT%H%M")
         user_suffix = f"-{self.participant_name}" if self.participant_name else ""
         order_suffix = f"-{self.order_code}" if self.order_code else ""
         csv_filename = f"{timestamp_str}{user_suffix}{order_suffix}-questionnaires.csv"
         csv_path = os.path.join(questionnaire_dir, csv_filename)
         
-        # Collect response values
-        frequency = int(self.sande_responses["frequency"].get())
-        severity = int(self.sande_responses["severity"].get())
+        # Collect response values: SANDE first, then OSDI-6 in question order
+        rows = [
+            ("SANDE", "frequency", int(self.sande_responses["frequency"].get())),
+            ("SANDE", "severity", int(self.sande_responses["severity"].get())),
+        ]
+        rows += [("OSDI6", f"q{i}", var.get()) for i, var in enumerate(self._osdi_vars, 1)]
         
         # Write to CSV
         try:
-            with open(csv_path, "w", encoding="utf-8") as f:
-                # Write headers
-                f.write("questionnaire,question,response\n")
-                
-                # Write SANDE responses
-                f.write(f"SANDE,frequency,{frequency}\n")
-                f.write(f"SANDE,severity,{severity}\n")
-                
-                # Write OSDI-6 responses
-                for i in range(1, 7):
-                    response = self.osdi_responses[f"q{i}"].get()
-                    f.write(f"OSDI6,q{i},{response}\n")
+            with open(csv_path, "w", encoding="utf-8", newline="") as f:
+                writer = csv.writer(f, lineterminator="\n")
+                writer.writerow(("questionnaire", "question", "response"))
+                writer.writerows(rows)
             
             print(f"Questionnaire responses saved to: {csv_path}")
         except Exception as e:
@@ -586,6 +655,13 @@ class TriviaMCQWindow(tk.Toplevel):
     Displays questions one at a time with 5 choices and a countdown timer.
     """
     
+    # Choice styles for the selected and unselected answers
+    _CHOICE_SELECTED = {"bg": "#10b981", "fg": "#03241b", "font": ("Segoe UI", 11, "bold"), "borderwidth": 3}
+    _CHOICE_UNSELECTED = {"bg": "#374151", "fg": "#e5e7eb", "font": ("Segoe UI", 11), "borderwidth": 2}
+    
+    # Parsed trivia files: (path, mtime_ns) -> (questions, title)
+    _trivia_cache = {}
+    
     def __init__(self, parent, trivia_file="", duration_seconds=300, participant_name="", order_code="", save_dir=""):
         super().__init__(parent)
         
@@ -597,23 +673,31 @@ class TriviaMCQWindow(tk.Toplevel):
         
         # Trivia state
         self.questions = []
+        self.choice_orders = []  # Per question: (shuffled original choice indices, shuffled position of correct answer)
         self.current_question_index = 0
         self.score = 0
         self.total_shown = 0
         self.start_time = None
+        self._last_remaining = -1  # Whole seconds left at the last timer redraw
         self.responses = []  # Store all responses for later analysis
         
+        # Output folder and file name prefix, fixed when the task starts
+        self._trivia_dir = os.path.join(save_dir, "trivia") if save_dir else _DEFAULT_TRIVIA_DIR
+        user_suffix = f"-{participant_name}" if participant_name else ""
+        order_suffix = f"-{order_code}" if order_code else ""
+        self._file_prefix = f"{time.strftime('%Y%m%dT%H%M')}{user_suffix}{order_suffix}"
+        
         self.title("Interactive Task - Trivia Questions")
+        self.resizable(False, False)  # Fixed 1400x800 layout; no resize re-layout
         self.configure(bg="#1f2937")
         
         # Fonts
-        self.title_font = font.Font(family="Segoe UI", size=14, weight="bold")
-        self.label_font = font.Font(family="Segoe UI", size=11)
-        self.small_font = font.Font(family="Segoe UI", size=9)
-        self.large_font = font.Font(family="Segoe UI", size=16, weight="bold")
+        self.title_font = TITLE_FONT
+        self.label_font = LABEL_FONT
+        self.small_font = SMALL_FONT
+        self.large_font = LARGE_FONT
         
         # Size and center window - 1400x800
-        self.geometry("1400x800")
         screen_w = self.winfo_screenwidth()
         screen_h = self.winfo_screenheight()
         x = (screen_w - 1400) // 2
@@ -628,15 +712,11 @@ class TriviaMCQWindow(tk.Toplevel):
         self.content_container.pack(expand=True, fill="both")
         
         # Progress bar at bottom
-        self.progress_frame = tk.Frame(self, bg="#374151", height=30)
-        self.progress_frame.pack(side="bottom", fill="x")
-        self.progress_frame.pack_propagate(False)
-        
-        self.progress_bar = tk.Frame(self.progress_frame, bg="#10b981")
-        self.progress_bar.place(x=0, y=0, relwidth=1.0, relheight=1.0)
+        self.progress_canvas = ProgressCanvas(self)
+        self.progress_canvas.pack(side="bottom", fill="x")
         
         self.progress_label = tk.Label(
-            self.progress_frame,
+            self.progress_canvas,
             text="Time remaining: 0:00",
             bg="#10b981",
             fg="#ffffff",
@@ -645,10 +725,11 @@ class TriviaMCQWindow(tk.Toplevel):
         self.progress_label.place(relx=0.5, rely=0.5, anchor="center")
         
         # Start timer
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         
         # Show first question or completion if no questions
         if self.questions:
+            self._build_question_page()
             self._show_question()
             self._update_timer()
         else:
@@ -659,7 +740,9 @@ class TriviaMCQWindow(tk.Toplevel):
     
     def _load_questions(self):
         """Load questions from JSON file and randomize"""
-        if not self.trivia_file or not os.path.exists(self.trivia_file):
+        try:
+            mtime_ns = os.stat(self.trivia_file).st_mtime_ns
+        except OSError:
             messagebox.showerror(
                 "Error",
                 f"Trivia file not found: {self.trivia_file}",
@@ -668,15 +751,27 @@ class TriviaMCQWindow(tk.Toplevel):
             return
         
         try:
-            with open(self.trivia_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                self.questions = data.get('questions', [])
-                self.trivia_title = data.get('title', 'Trivia Questions')
-                
-                # Randomize question order
-                random.shuffle(self.questions)
-                
-                print(f"Loaded {len(self.questions)} questions from {self.trivia_file}")
+            # Reuse the parsed file from an earlier window unless it has been modified since
+            key = (self.trivia_file, mtime_ns)
+            if key not in self._trivia_cache:
+                with open(self.trivia_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                self._trivia_cache[key] = (data.get('questions', []), data.get('title', 'Trivia Questions'))
+            questions, self.trivia_title = self._trivia_cache[key]
+            
+            # Randomize question order (on a copy, so the cached list keeps the file order)
+            self.questions = list(questions)
+            random.shuffle(self.questions)
+            
+            # Shuffle each question's choices up front to avoid position bias
+            self.choice_orders = []
+            for question_data in self.questions:
+                n_choices = len(question_data.get('choices', []))
+                order = random.sample(range(n_choices), n_choices)
+                correct = question_data.get('correct', -1)
+                self.choice_orders.append((order, order.index(correct) if correct in order else -1))
+            
+            print(f"Loaded {len(self.questions)} questions from {self.trivia_file}")
         except Exception as e:
             messagebox.showerror(
                 "Error",
@@ -685,19 +780,8 @@ class TriviaMCQWindow(tk.Toplevel):
             )
             self.questions = []
     
-    def _show_question(self):
-        """Display current question"""
-        # Clear content
-        for widget in self.content_container.winfo_children():
-            widget.destroy()
-        
-        if self.current_question_index >= len(self.questions):
-            # No more questions, show completion
-            self._show_completion()
-            return
-        
-        question_data = self.questions[self.current_question_index]
-        
+    def _build_question_page(self):
+        """Build the question page once; _show_question fills it in for each question"""
         # Container for centering
         container = tk.Frame(self.content_container, bg="#1f2937")
         container.pack(expand=True, fill="both")
@@ -709,97 +793,40 @@ class TriviaMCQWindow(tk.Toplevel):
         header_frame = tk.Frame(content, bg="#1f2937")
         header_frame.pack(fill="x", pady=(20, 10))
         
-        question_num_label = tk.Label(
+        self.question_num_label = tk.Label(
             header_frame,
-            text=f"Question {self.total_shown + 1}",
             bg="#1f2937",
             fg="#ffffff",
             font=self.label_font
         )
-        question_num_label.pack(side="left", padx=(0, 20))
+        self.question_num_label.pack(side="left", padx=(0, 20))
         
-        score_label = tk.Label(
+        self.score_label = tk.Label(
             header_frame,
-            text=f"Score: {self.score}/{self.total_shown}",
             bg="#1f2937",
             fg="#10b981",
             font=self.label_font
         )
-        score_label.pack(side="left")
+        self.score_label.pack(side="left")
         
         # Question text
-        q_label = tk.Label(
+        self.q_label = tk.Label(
             content,
-            text=question_data.get('question', ''),
             bg="#1f2937",
             fg="#ffffff",
             font=self.title_font,
-            wraplength=1000,
             justify="left"
         )
-        q_label.pack(pady=(10, 30), padx=40)
-        
-        # Shuffle choices to avoid position bias
-        original_choices = question_data.get('choices', [])
-        original_correct = question_data.get('correct', -1)
-        
-        # Create list of (index, choice_text) pairs and shuffle
-        indexed_choices = list(enumerate(original_choices))
-        random.shuffle(indexed_choices)
-        
-        # Track which shuffled position contains the correct answer
-        self.current_correct_index = -1
-        for shuffled_idx, (original_idx, choice_text) in enumerate(indexed_choices):
-            if original_idx == original_correct:
-                self.current_correct_index = shuffled_idx
-                break
+        self.q_label.pack(pady=(10, 30), padx=40)
         
         self.selected_answer = tk.IntVar(value=-1)
         
-        choices_frame = tk.Frame(content, bg="#1f2937")
-        choices_frame.pack(pady=(0, 30), padx=40, fill="x")
+        self.choices_frame = tk.Frame(content, bg="#1f2937")
+        self.choices_frame.pack(pady=(0, 30), padx=40, fill="x")
         
-        # Store choice buttons for styling updates
+        # Choice labels, added as needed for the question with the most choices so far
         self.choice_buttons = []
         
-        # Display shuffled choices as large touch-friendly buttons
-        for shuffled_idx, (original_idx, choice_text) in enumerate(indexed_choices):
-            # Create a frame for each choice to make the entire area clickable
-            choice_container = tk.Frame(
-                choices_frame,
-                bg="#374151",
-                relief="solid",
-                borderwidth=2,
-                highlightthickness=0
-            )
-            choice_container.pack(fill="x", pady=6, ipady=8, ipadx=12)
-            
-            # Use a button-style approach for better touch targets
-            def make_select_callback(idx):
-                return lambda event=None: self._select_choice(idx)
-            
-            choice_label = tk.Label(
-                choice_container,
-                text=choice_text,
-                bg="#374151",
-                fg="#e5e7eb",
-                font=self.label_font,
-                wraplength=1000,
-                justify="left",
-                cursor="hand2",
-                anchor="w",
-                padx=20,
-                pady=12
-            )
-            choice_label.pack(fill="both", expand=True)
-            
-            # Make the entire container clickable
-            choice_container.bind("<Button-1>", make_select_callback(shuffled_idx))
-            choice_label.bind("<Button-1>", make_select_callback(shuffled_idx))
-            
-            # Store for later styling
-            self.choice_buttons.append((choice_container, choice_label))
-        
         # Submit button
         submit_btn = tk.Button(
             content,
@@ -814,20 +841,70 @@ class TriviaMCQWindow(tk.Toplevel):
         )
         submit_btn.pack(pady=(10, 20))
     
-    def _select_choice(self, choice_index):
+    def _add_choice_label(self):
+        """Add another touch-friendly choice to the question page"""
+        # One bordered label per choice, padded to the size the old frame + label pair had
+        choice_label = tk.Label(
+            self.choices_frame,
+            relief="solid",
+            highlightthickness=0,
+            justify="left",
+            cursor="hand2",
+            anchor="w",
+            padx=32,
+            pady=20,
+            **self._CHOICE_UNSELECTED
+        )
+        choice_label.bind("<Button-1>", partial(self._select_choice, len(self.choice_buttons)))
+        self.choice_buttons.append(choice_label)
+    
+    def _show_question(self):
+        """Display current question"""
+        if self.current_question_index >= len(self.questions):
+            # No more questions, show completion
+            self._show_completion()
+            return
+        
+        question_data = self.questions[self.current_question_index]
+        
+        self.question_num_label.config(text=f"Question {self.total_shown + 1}")
+        self.score_label.config(text=f"Score: {self.score}/{self.total_shown}")
+        self.q_label.config(text=textwrap.fill(question_data.get('question', ''), _TRIVIA_QUESTION_WRAP))
+        
+        # Choices in the order shuffled at load time, and the position of the correct answer
+        original_choices = question_data.get('choices', [])
+        choice_order, self.current_correct_index = self.choice_orders[self.current_question_index]
+        
+        # Clear the previous question's selection
+        previous = self.selected_answer.get()
+        if previous != -1:
+            self.choice_buttons[previous].config(**self._CHOICE_UNSELECTED)
+        self.selected_answer.set(-1)
+        
+        # Display shuffled choices as large touch-friendly buttons; hide any left over
+        # from a question with more choices
+        while len(self.choice_buttons) < len(choice_order):
+            self._add_choice_label()
+        for shuffled_idx, choice_label in enumerate(self.choice_buttons):
+            if shuffled_idx < len(choice_order):
+                choice_label.config(text=textwrap.fill(str(original_choices[choice_order[shuffled_idx]]), _TRIVIA_CHOICE_WRAP))
+                choice_label.pack(fill="x", pady=6)
+            else:
+                choice_label.pack_forget()
+    
+    def _select_choice(self, choice_index, event=None):
         """Handle choice selection with visual feedback"""
+        previous = self.selected_answer.get()
+        if previous == choice_index:
+            return  # Same choice tapped again; nothing to restyle
         self.selected_answer.set(choice_index)
         
-        # Update visual styling for all choices
-        for idx, (container, label) in enumerate(self.choice_buttons):
-            if idx == choice_index:
-                # Selected style - bright highlight
-                container.config(bg="#10b981", borderwidth=3)
-                label.config(bg="#10b981", fg="#03241b", font=("Segoe UI", 11, "bold"))
-            else:
-                # Unselected style - default
-                container.config(bg="#374151", borderwidth=2)
-                label.config(bg="#374151", fg="#e5e7eb", font=("Segoe UI", 11))
+        # Restyle only the previously selected choice and the new one
+        if previous != -1:
+            # Unselected style - default
+            self.choice_buttons[previous].config(**self._CHOICE_UNSELECTED)
+        # Selected style - bright highlight
+        self.choice_buttons[choice_index].config(**self._CHOICE_SELECTED)
     
     def _submit_answer(self):
         """Process the submitted answer"""
@@ -849,21 +926,21 @@ class TriviaMCQWindow(tk.Toplevel):
             self.score += 1
         
         # Store response
-        self.responses.append({
-            'question_id': question_data.get('id', self.current_question_index),
-            'question': question_data.get('question', ''),
-            'user_answer_position': user_answer,
-            'correct_answer_position': self.current_correct_index,
-            'original_correct_index': original_correct,
-            'is_correct': is_correct,
-            'timestamp': time.time() - self.start_time
-        })
+        self.responses.append(TriviaResponse(
+            question_data.get('id', self.current_question_index),
+            question_data.get('question', ''),
+            user_answer,
+            self.current_correct_index,
+            original_correct,
+            is_correct,
+            time.perf_counter() - self.start_time
+        ))
         
         self.total_shown += 1
         self.current_question_index += 1
         
         # Check if time is up
-        elapsed = time.time() - self.start_time
+        elapsed = time.perf_counter() - self.start_time
         if elapsed >= self.duration_seconds:
             self._show_completion()
         else:
@@ -879,25 +956,28 @@ class TriviaMCQWindow(tk.Toplevel):
         if not self.start_time:
             return
         
-        elapsed = time.time() - self.start_time
+        elapsed = time.perf_counter() - self.start_time
         remaining = max(0, self.duration_seconds - elapsed)
         
-        # Update progress bar width
-        progress_ratio = remaining / self.duration_seconds
-        self.progress_bar.place(x=0, y=0, relwidth=progress_ratio, relheight=1.0)
-        
-        # Update time text
-        mins = int(remaining // 60)
-        secs = int(remaining % 60)
-        self.progress_label.config(text=f"Time remaining: {mins}:{secs:02d}")
+        # Redraw only when the displayed second changes
+        remaining_secs = int(remaining)
+        if remaining_secs != self._last_remaining:
+            self._last_remaining = remaining_secs
+            
+            # Update progress bar width
+            self.progress_canvas.set_ratio(remaining / self.duration_seconds)
+            
+            # Update time text
+            mins, secs = divmod(remaining_secs, 60)
+            self.progress_label.config(text=_TIME_REMAINING_FMT % (mins, secs))
         
         # Check if time is up
         if remaining <= 0:
             self._show_completion()
             return
         
-        # Schedule next update (smooth animation)
-        self.after(100, self._update_timer)
+        # Schedule next check just after the next whole-second boundary
+        self.after(int((remaining % 1) * 1000) + 50, self._update_timer)
     
     def _show_completion(self):
         """Show completion screen with final score"""
@@ -909,7 +989,7 @@ class TriviaMCQWindow(tk.Toplevel):
             widget.destroy()
         
         # Hide progress bar
-        self.progress_frame.pack_forget()
+        self.progress_canvas.pack_forget()
         
         # Save results
         self._save_results()
@@ -976,56 +1056,34 @@ class TriviaMCQWindow(tk.Toplevel):
             return
         
         # Create trivia subfolder if it doesn't exist
-        if self.save_dir:
-            trivia_dir = os.path.join(self.save_dir, "trivia")
-        else:
-            trivia_dir = os.path.join(os.path.dirname(__file__), "trivia")
+        os.makedirs(self._trivia_dir, exist_ok=True)
         
-        os.makedirs(trivia_dir, exist_ok=True)
-        
-        # Generate filename
-        timestamp_str = datetime.now().strftime("%Y%m%dT%H%M")
-        user_suffix = f"-{self.participant_name}" if self.participant_name else ""
-        order_suffix = f"-{self.order_code}" if self.order_code else ""
-        csv_filename = f"{timestamp_str}{user_suffix}{order_suffix}-trivia.csv"
-        csv_path = os.path.join(trivia_dir, csv_filename)
+        csv_path = os.path.join(self._trivia_dir, f"{self._file_prefix}-trivia.csv")
         
         # Write to CSV
         try:
-            with open(csv_path, "w", encoding="utf-8") as f:
-                # Write headers
-                f.write("question_id,question,user_answer_position,correct_answer_position,original_correct_index,is_correct,timestamp\n")
-                
-                # Write responses
-                for response in self.responses:
-                    question = response['question'].replace('"', '""')  # Escape quotes
-                    f.write(
-                        f'{response["question_id"]},'
-                        f'"{question}",'
-                        f'{response["user_answer_position"]},'
-                        f'{response["correct_answer_position"]},'
-                        f'{response["original_correct_index"]},'
-                        f'{response["is_correct"]},'
-                        f'{response["timestamp"]:.2f}\n'
-                    )
+            with open(csv_path, "w", encoding="utf-8", newline="") as f:
+                writer = csv.writer(f, lineterminator="\n")
+                writer.writerow(TriviaResponse._fields)
+                writer.writerows((*r[:-1], f"{r.timestamp:.2f}") for r in self.responses)
             
             # Write summary file
             summary_path = csv_path.replace('-trivia.csv', '-trivia-summary.txt')
-            with open(summary_path, "w", encoding="utf-8") as f:
-                f.write(f"Trivia Task Summary\n")
-                f.write(f"==================\n\n")
-                f.write(f"Participant: {self.participant_name}\n")
-                f.write(f"Order Code: {self.order_code}\n")
-                f.write(f"Trivia File: {os.path.basename(self.trivia_file)}\n")
-                f.write(f"Duration: {self.duration_seconds} seconds\n\n")
-                f.write(f"Results:\n")
-                f.write(f"  Questions Answered: {self.total_shown}\n")
-                f.write(f"  Correct Answers: {self.score}\n")
-                f.write(f"  Score: {self.score}/{self.total_shown}")
-                if self.total_shown > 0:
-                    f.write(f" ({(self.score/self.total_shown)*100:.1f}%)\n")
-                else:
-                    f.write("\n")
+            percent = f" ({(self.score/self.total_shown)*100:.1f}%)" if self.total_shown > 0 else ""
+            summary = (
+                f"Trivia Task Summary\n"
+                f"==================\n\n"
+                f"Participant: {self.participant_name}\n"
+                f"Order Code: {self.order_code}\n"
+                f"Trivia File: {os.path.basename(self.trivia_file)}\n"
+                f"Duration: {self.duration_seconds} seconds\n\n"
+                f"Results:\n"
+                f"  Questions Answered: {self.total_shown}\n"
+                f"  Correct Answers: {self.score}\n"
+                f"  Score: {self.score}/{self.total_shown}{percent}\n"
+            )
+            with open(summary_path, "w", encoding="utf-8", newline="") as f:
+                f.write(summary)
             
             print(f"Trivia results saved to: {csv_path}")
             print(f"Trivia summary saved to: {summary_path}")
@@ -1086,6 +1144,7 @@ class InteractiveTaskWindow(tk.Toplevel):
 
         # SANDE state
         self.sande_responses = {}
+        self._sande_drag_after = {}  # Pending drag redraw (after id) per SANDE slider key
         
         # OSDI state
         self.osdi_responses = {}
@@ -1110,18 +1169,23 @@ class InteractiveTaskWindow(tk.Toplevel):
         self.demographics_time = {}
         self.sande_time = {}
         self.osdi_time = {}
+
+        # (variable, trace id) pairs removed again on destroy
+        self._traces = []
+        self._last_remaining = None  # Last whole second shown in the timer label
+        self._last_ratio = None  # Progress bar width ratio at the last redraw
         
         self.title("Interactive Task")
         self.configure(bg="#1f2937")
         
         # Shared fonts
-        self.title_font = font.Font(family="Segoe UI", size=14, weight="bold")
-        self.label_font = font.Font(family="Segoe UI", size=11)
-        self.small_font = font.Font(family="Segoe UI", size=9)
-        self.large_font = font.Font(family="Segoe UI", size=16, weight="bold")
+        self.title_font = TITLE_FONT
+        self.label_font = LABEL_FONT
+        self.heading_font = HEADING_FONT
+        self.small_font = SMALL_FONT
+        self.large_font = LARGE_FONT
         
         # Size and center window - consistent 1400x800
-        self.geometry("1400x800")
         screen_w = self.winfo_screenwidth()
         screen_h = self.winfo_screenheight()
         x = (screen_w - 1400) // 2
@@ -1133,15 +1197,11 @@ class InteractiveTaskWindow(tk.Toplevel):
         self.content_container.pack(expand=True, fill="both")
         
         # Progress bar at bottom (shared across all sections)
-        self.progress_frame = tk.Frame(self, bg="#374151", height=30)
-        self.progress_frame.pack(side="bottom", fill="x")
-        self.progress_frame.pack_propagate(False)
-        
-        self.progress_bar = tk.Frame(self.progress_frame, bg="#10b981")
-        self.progress_bar.place(x=0, y=0, relwidth=1.0, relheight=1.0)
+        self.progress_canvas = ProgressCanvas(self)
+        self.progress_canvas.pack(side="bottom", fill="x")
         
         self.progress_label = tk.Label(
-            self.progress_frame,
+            self.progress_canvas,
             text="Time remaining: --:--",
             bg="#10b981",
             fg="#ffffff",
@@ -1174,11 +1234,12 @@ class InteractiveTaskWindow(tk.Toplevel):
             self.after(100, self.on_ready_callback)
         
         # Start the timer
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         self._update_timer()
     
     def _clear_content(self):
         """Clear the current content container"""
+        self._cancel_sande_drags()
         for widget in self.content_container.winfo_children():
             widget.destroy()
     
@@ -1215,7 +1276,6 @@ class InteractiveTaskWindow(tk.Toplevel):
             wraplength=1000
         ).pack(pady=(0, 30))
 
-        heading_font = font.Font(family="Segoe UI", size=11, weight="bold")
 
         # Q1: Age
         age_frame = tk.Frame(content, bg="#1f2937")
@@ -1225,7 +1285,7 @@ class InteractiveTaskWindow(tk.Toplevel):
             text="1. How old are you?",
             bg="#1f2937",
             fg="#ffffff",
-            font=heading_font,
+            font=self.heading_font,
             anchor="w"
         ).pack(fill="x", pady=(0, 8))
         self._age_var = tk.StringVar()
@@ -1251,8 +1311,8 @@ class InteractiveTaskWindow(tk.Toplevel):
 
         def _on_age_change(*args):
             if self.start_time:
-                self.demographics_time["age"] = int((time.time() - self.start_time) * 1000)
-        self._age_var.trace_add("write", _on_age_change)
+                self.demographics_time["age"] = int((time.perf_counter() - self.start_time) * 1000)
+        self._traces.append((self._age_var, self._age_var.trace_add("write", _on_age_change)))
 
         # Q2: Gender
         gender_frame = tk.Frame(content, bg="#1f2937")
@@ -1262,7 +1322,7 @@ class InteractiveTaskWindow(tk.Toplevel):
             text="2. What is your gender?",
             bg="#1f2937",
             fg="#ffffff",
-            font=heading_font,
+            font=self.heading_font,
             anchor="w"
         ).pack(fill="x", pady=(0, 8))
         gender_options = ["Prefer not to say", "Male", "Female", "Non-binary", "Other"]
@@ -1278,8 +1338,8 @@ class InteractiveTaskWindow(tk.Toplevel):
 
         def _on_gender_change(*args):
             if self.start_time:
-                self.demographics_time["gender"] = int((time.time() - self.start_time) * 1000)
-        self._gender_var.trace_add("write", _on_gender_change)
+                self.demographics_time["gender"] = int((time.perf_counter() - self.start_time) * 1000)
+        self._traces.append((self._gender_var, self._gender_var.trace_add("write", _on_gender_change)))
 
         # Q3: Contact lenses
         contacts_frame = tk.Frame(content, bg="#1f2937")
@@ -1289,7 +1349,7 @@ class InteractiveTaskWindow(tk.Toplevel):
             text="3. Are you wearing contact lenses?",
             bg="#1f2937",
             fg="#ffffff",
-            font=heading_font,
+            font=self.heading_font,
             anchor="w"
         ).pack(fill="x", pady=(0, 8))
         self._contacts_var = tk.StringVar(value="")
@@ -1317,7 +1377,7 @@ class InteractiveTaskWindow(tk.Toplevel):
             def cmd():
                 self._contacts_var.set(opt)
                 if self.start_time:
-                    self.demographics_time["contact_lenses"] = int((time.time() - self.start_time) * 1000)
+                    self.demographics_time["contact_lenses"] = int((time.perf_counter() - self.start_time) * 1000)
                 for b in btns:
                     b.config(bg="#374151", fg="#e5e7eb")
                 btns[0 if opt == "Yes" else 1].config(bg="#3b82f6", fg="#ffffff")
@@ -1367,7 +1427,7 @@ class InteractiveTaskWindow(tk.Toplevel):
             return
 
         # Ensure timestamps recorded for all fields
-        now_ms = int((time.time() - self.start_time) * 1000) if self.start_time else 0
+        now_ms = int((time.perf_counter() - self.start_time) * 1000) if self.start_time else 0
         self.demographics_time.setdefault("age", now_ms)
         self.demographics_time.setdefault("gender", now_ms)
         self.demographics_time.setdefault("contact_lenses", now_ms)
@@ -1378,7 +1438,7 @@ class InteractiveTaskWindow(tk.Toplevel):
             "gender": self._gender_var.get(),
             "contact_lenses": self._contacts_var.get()
         }
-        self.all_responses['demographics'] = self.demographics_responses.copy()
+        self.all_responses['demographics'] = self.demographics_responses
 
         # Move to next section
         if self.enable_sande:
@@ -1469,13 +1529,12 @@ class InteractiveTaskWindow(tk.Toplevel):
         question_frame.pack(pady=20, padx=40, fill="x")
         
         # Question heading (bold) with number
-        heading_font = font.Font(family="Segoe UI", size=11, weight="bold")
         heading_label = tk.Label(
             question_frame,
             text=f"{question_number}. {question_heading}",
             bg="#1f2937",
             fg="#ffffff",
-            font=heading_font,
+            font=self.heading_font,
             anchor="w",
             justify="left"
         )
@@ -1542,6 +1601,10 @@ class InteractiveTaskWindow(tk.Toplevel):
         # Store initial value
         self.sande_responses[key] = None
         
+        # Filled portion and marker, hidden until the first selection and then moved in place
+        fill_id = canvas.create_rectangle(0, 0, 0, canvas_height, fill="#3b82f6", outline="", state="hidden")
+        marker_id = canvas.create_oval(0, 0, 0, 0, fill="#ffffff", outline="#3b82f6", width=2, state="hidden")
+        
         def update_slider(x):
             """Update slider based on x position"""
             canvas_width = canvas.winfo_width()
@@ -1553,39 +1616,56 @@ class InteractiveTaskWindow(tk.Toplevel):
                 self.sande_responses[key] = value
                 # Record timestamp (ms since task start)
                 if self.start_time:
-                    self.sande_time[key] = int((time.time() - self.start_time) * 1000)
+                    self.sande_time[key] = int((time.perf_counter() - self.start_time) * 1000)
                 
                 # Update visual feedback
-                canvas.delete("all")
-                
-                # Draw filled portion
-                fill_width = (value / 100) * canvas_width
-                canvas.create_rectangle(
-                    0, 0, fill_width, canvas_height,
-                    fill="#3b82f6", outline=""
-                )
-                
-                # Draw marker at position
                 x_pos = (value / 100) * canvas_width
-                canvas.create_oval(
+                canvas.coords(fill_id, 0, 0, x_pos, canvas_height)
+                canvas.coords(
+                    marker_id,
                     x_pos - 8, canvas_height // 2 - 8,
-                    x_pos + 8, canvas_height // 2 + 8,
-                    fill="#ffffff", outline="#3b82f6", width=2
+                    x_pos + 8, canvas_height // 2 + 8
                 )
+                canvas.itemconfig(fill_id, state="normal")
+                canvas.itemconfig(marker_id, state="normal")
                 
                 # Update value label
                 value_label.config(text=f"{value}/100", fg="#10b981")
         
+        # Drag updates are coalesced to at most one redraw per ~16 ms frame; the pending
+        # after id is kept in _sande_drag_after so leaving the page can cancel it
+        last_x = [0]
+        
+        def flush_drag():
+            self._sande_drag_after.pop(key, None)
+            update_slider(last_x[0])
+        
         def on_click(event):
             """Handle click on canvas"""
             update_slider(event.x)
         
         def on_drag(event):
             """Handle drag on canvas"""
-            update_slider(event.x)
+            last_x[0] = event.x
+            if key not in self._sande_drag_after:
+                self._sande_drag_after[key] = canvas.after(16, flush_drag)
+        
+        def on_release(event):
+            """Apply a drag position still waiting for its redraw right away"""
+            after_id = self._sande_drag_after.pop(key, None)
+            if after_id is not None:
+                canvas.after_cancel(after_id)
+                update_slider(last_x[0])
         
         canvas.bind("<Button-1>", on_click)
         canvas.bind("<B1-Motion>", on_drag)
+        canvas.bind("<ButtonRelease-1>", on_release)
+    
+    def _cancel_sande_drags(self):
+        """Cancel SANDE drag redraws still waiting for their timer"""
+        for after_id in self._sande_drag_after.values():
+            self.after_cancel(after_id)
+        self._sande_drag_after.clear()
     
     def _sande_next(self):
         """Validate SANDE and move to next section"""
@@ -1602,7 +1682,7 @@ class InteractiveTaskWindow(tk.Toplevel):
             return
         
         # Save SANDE responses
-        self.all_responses['sande'] = self.sande_responses.copy()
+        self.all_responses['sande'] = self.sande_responses
         
         # Move to next section
         if self.enable_osdi:
@@ -1693,14 +1773,12 @@ class InteractiveTaskWindow(tk.Toplevel):
     
     def _add_osdi_section_header(self, parent, header_text):
         """Add a section header for OSDI questions"""
-        # Create bold font for section headers
-        header_font = font.Font(family="Segoe UI", size=11, weight="bold")
         header = tk.Label(
             parent,
             text=header_text,
             bg="#1f2937",
             fg="#ffffff",  # Changed to white like SANDE headings
-            font=header_font,  # Now bold
+            font=self.heading_font,  # Now bold
             wraplength=1000,
             justify="left"
         )
@@ -1731,25 +1809,11 @@ class InteractiveTaskWindow(tk.Toplevel):
         self.osdi_responses[key] = None
         self.osdi_buttons[key] = {}  # Changed to dict for value->button mapping
         
-        # Correct OSDI-6 response options
-        options = [
-            ("Constantly", 4),
-            ("Mostly", 3),
-            ("Often", 2),
-            ("Sometimes", 1),
-            ("Never", 0)
-        ]
-        
-        def make_handler(option_key, value):
-            def handler():
-                self._select_osdi_option(option_key, value)
-            return handler
-        
-        for text, value in options:
+        for text, value in _OSDI_OPTIONS:
             btn = tk.Button(
                 options_frame,
                 text=text,
-                command=make_handler(key, value),
+                command=partial(self._select_osdi_option, key, value),
                 font=self.small_font,
                 bg="#374151",
                 fg="#cbd5e1",
@@ -1766,16 +1830,18 @@ class InteractiveTaskWindow(tk.Toplevel):
     
     def _select_osdi_option(self, key, value):
         """Handle OSDI option selection with visual feedback"""
+        previous = self.osdi_responses[key]
         self.osdi_responses[key] = value
         if self.start_time:
-            self.osdi_time[key] = int((time.time() - self.start_time) * 1000)
+            self.osdi_time[key] = int((time.perf_counter() - self.start_time) * 1000)
         
-        # Update button styles - now using dict mapping
-        for btn_value, btn in self.osdi_buttons[key].items():
-            if btn_value == value:
-                btn.config(bg="#3b82f6", fg="#ffffff")
-            else:
-                btn.config(bg="#374151", fg="#cbd5e1")
+        # Restyle only the previously selected button and the new one
+        if previous == value:
+            return
+        buttons = self.osdi_buttons[key]
+        if previous is not None:
+            buttons[previous].config(bg="#374151", fg="#cbd5e1")
+        buttons[value].config(bg="#3b82f6", fg="#ffffff")
     
     def _osdi_next(self):
         """Validate OSDI and move to trivia"""
@@ -1792,7 +1858,7 @@ class InteractiveTaskWindow(tk.Toplevel):
             return
         
         # Save OSDI responses
-        self.all_responses['osdi'] = self.osdi_responses.copy()
+        self.all_responses['osdi'] = self.osdi_responses
         
         # Move to trivia
         self._show_trivia()
@@ -1808,8 +1874,7 @@ class InteractiveTaskWindow(tk.Toplevel):
         try:
             with open(self.trivia_file, 'r', encoding='utf-8') as f:
                 data = json.load(f)
-                self.questions = data.get('questions', [])
-                random.shuffle(self.questions)
+                self.questions = data.get('questions', [])  # Shuffled lazily as questions are shown
         except Exception as e:
             print(f"Error loading trivia questions: {e}")
             self.questions = []
@@ -1823,18 +1888,12 @@ class InteractiveTaskWindow(tk.Toplevel):
             self._show_completion()
             return
         
+        self._clear_content()
+        self._build_trivia_page()
         self._show_question()
     
-    def _show_question(self):
-        """Display current trivia question"""
-        self._clear_content()
-        
-        if self.current_question_index >= len(self.questions):
-            self._show_completion()
-            return
-        
-        question_data = self.questions[self.current_question_index]
-        
+    def _build_trivia_page(self):
+        """Build the trivia page once; _show_question fills it in for each question"""
         # Container
         container = tk.Frame(self.content_container, bg="#1f2937")
         container.pack(expand=True, fill="both")
@@ -1844,31 +1903,64 @@ class InteractiveTaskWindow(tk.Toplevel):
         content.pack(expand=True)
         
         # Progress indicator (just question number, not total) - large white text
-        progress_text = f"Question {self.current_question_index + 1}"
-        progress_label = tk.Label(
+        self.trivia_progress_label = tk.Label(
             content,
-            text=progress_text,
             bg="#1f2937",  # Same as background (no visible background)
             fg="#ffffff",  # White text
             font=self.title_font  # Larger font (size 14, bold)
         )
-        progress_label.pack(pady=(20, 10))
+        self.trivia_progress_label.pack(pady=(20, 10))
         
         # Question text
-        question_label = tk.Label(
+        self.trivia_question_label = tk.Label(
             content,
-            text=question_data['question'],
             bg="#1f2937",
             fg="#ffffff",
             font=self.large_font,
             wraplength=1000,
             justify="center"
         )
-        question_label.pack(pady=(10, 40))
+        self.trivia_question_label.pack(pady=(10, 40))
         
         # Choices frame
-        choices_frame = tk.Frame(content, bg="#1f2937")
-        choices_frame.pack(pady=20)
+        self.trivia_choices_frame = tk.Frame(content, bg="#1f2937")
+        self.trivia_choices_frame.pack(pady=20)
+        
+        # Choice buttons, added as needed for the question with the most choices so far
+        self.trivia_choice_buttons = []
+    
+    def _add_trivia_choice_button(self):
+        """Add another choice button (large, touch-friendly) to the trivia page"""
+        btn = tk.Button(
+            self.trivia_choices_frame,
+            font=self.label_font,
+            bg="#374151",
+            fg="#ffffff",
+            activebackground="#4b5563",
+            activeforeground="#ffffff",
+            relief="flat",
+            cursor="hand2",
+            padx=30,
+            pady=20,
+            width=60,
+            anchor="w"
+        )
+        self.trivia_choice_buttons.append(btn)
+    
+    def _show_question(self):
+        """Display current trivia question"""
+        if self.current_question_index >= len(self.questions):
+            self._show_completion()
+            return
+        
+        # Fisher-Yates step: draw this question at random from the ones not shown yet
+        i = self.current_question_index
+        j = random.randrange(i, len(self.questions))
+        self.questions[i], self.questions[j] = self.questions[j], self.questions[i]
+        question_data = self.questions[i]
+        
+        self.trivia_progress_label.config(text=f"Question {self.current_question_index + 1}")
+        self.trivia_question_label.config(text=question_data['question'])
         
         # Get correct answer (index-based in JSON)
         choices = question_data['choices'][:]
@@ -1878,73 +1970,60 @@ class InteractiveTaskWindow(tk.Toplevel):
         # Shuffle choices but track correct answer
         random.shuffle(choices)
         
-        # Store question start time
-        question_start_time = time.time()
+        while len(self.trivia_choice_buttons) < len(choices):
+            self._add_trivia_choice_button()
+        
+        # Reset the reused buttons for this question; hide any left over from a question
+        # with more choices
+        for idx, btn in enumerate(self.trivia_choice_buttons):
+            if idx < len(choices):
+                choice = choices[idx]
+                btn.config(
+                    text=choice,
+                    command=partial(self._on_trivia_choice, question_data, choice, correct_answer, btn),
+                    bg="#374151",
+                    fg="#ffffff",
+                    state="normal"
+                )
+                btn.pack(pady=8)
+            else:
+                btn.pack_forget()
+    
+    def _on_trivia_choice(self, question_data, choice, correct_answer, button):
+        """Record the chosen answer, flash feedback and move on to the next question"""
+        # Disable all buttons to prevent multiple clicks
+        for btn in self.trivia_choice_buttons:
+            btn.config(state="disabled")
+        
+        # Show visual feedback: green for the correct answer, red otherwise
+        is_correct = (choice == correct_answer)
+        if is_correct:
+            button.config(bg="#10b981", fg="#ffffff")
+        else:
+            button.config(bg="#ef4444", fg="#ffffff")
         
-        # Store button references for feedback
-        choice_buttons = []
+        # Record response with GLOBAL elapsed ms (continuous increasing)
+        elapsed_ms = 0
+        if self.start_time:
+            elapsed_ms = int((time.perf_counter() - self.start_time) * 1000)
+
+        self.trivia_responses.append(InteractiveTriviaResponse(
+            self.current_question_index + 1,
+            question_data['question'],
+            choice,
+            correct_answer,
+            is_correct,
+            elapsed_ms
+        ))
         
-        def make_choice_handler(choice, button, is_correct_choice):
-            def handler():
-                # Disable all buttons to prevent multiple clicks
-                for btn in choice_buttons:
-                    btn.config(state="disabled")
-                
-                # Show visual feedback
-                if is_correct_choice:
-                    # Flash green for correct answer
-                    button.config(bg="#10b981", fg="#ffffff")
-                else:
-                    # Flash red for incorrect answer
-                    button.config(bg="#ef4444", fg="#ffffff")
-                
-                # Record response with GLOBAL elapsed ms (continuous increasing)
-                is_correct = (choice == correct_answer)
-                elapsed_ms = 0
-                if self.start_time:
-                    elapsed_ms = int((time.time() - self.start_time) * 1000)
-
-                self.trivia_responses.append({
-                    'question_number': self.current_question_index + 1,
-                    'question': question_data['question'],
-                    'selected_answer': choice,
-                    'correct_answer': correct_answer,
-                    'is_correct': is_correct,
-                    'elapsed_ms': elapsed_ms
-                })
-                
-                if is_correct:
-                    self.score += 1
-                
-                self.total_shown += 1
-                
-                # Move to next question after brief delay 150ms)
-                self.current_question_index += 1
-                self.after(150, self._show_question)
-            
-            return handler
+        if is_correct:
+            self.score += 1
         
-        # Create choice buttons (large, touch-friendly)
-        for i, choice in enumerate(choices):
-            is_correct_choice = (choice == correct_answer)
-            btn = tk.Button(
-                choices_frame,
-                text=choice,  # Removed f"{chr(65 + i)}. " prefix
-                font=self.label_font,
-                bg="#374151",
-                fg="#ffffff",
-                activebackground="#4b5563",
-                activeforeground="#ffffff",
-                relief="flat",
-                cursor="hand2",
-                padx=30,
-                pady=20,
-                width=60,
-                anchor="w"
-            )
-            btn.config(command=make_choice_handler(choice, btn, is_correct_choice))
-            btn.pack(pady=8)
-            choice_buttons.append(btn)
+        self.total_shown += 1
+        
+        # Move to next question after brief delay 150ms)
+        self.current_question_index += 1
+        self.after(150, self._show_question)
     
     def _show_completion(self):
         """Complete the task and close window immediately"""
@@ -1959,47 +2038,49 @@ class InteractiveTaskWindow(tk.Toplevel):
         if not self.save_dir:
             return
         
-        # Create interactive_tasks directory
+        # interactive_tasks directory
         save_path = os.path.join(self.save_dir, "interactive_tasks")
-        os.makedirs(save_path, exist_ok=True)
         
         # Generate filename with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         filename = f"{timestamp}-{self.participant_name}-{self.order_code}-I.csv"
         filepath = os.path.join(save_path, filename)
         
+        # Time recorded for answers without their own timestamp: now, in ms since task start
+        end_ms = int((time.perf_counter() - self.start_time) * 1000) if self.start_time else 0
+        
+        # Rows: section, question, response, value, ms since interactive task start
+        rows = []
+
+        # Demographics responses
+        for key, value in self.all_responses['demographics'].items():
+            rows.append(("Demographics", key, value, value, self.demographics_time.get(key, end_ms)))
+
+        # SANDE responses (use recorded ms or fallback to end time)
+        for key, value in self.all_responses['sande'].items():
+            rows.append(("SANDE", key, value, value, self.sande_time.get(key, end_ms)))
+
+        # OSDI responses with correct labels
+        osdi_labels = ("Never", "Sometimes", "Often", "Mostly", "Constantly")
+        for key, value in self.all_responses['osdi'].items():
+            rows.append(("OSDI", key, osdi_labels[value], value, self.osdi_time.get(key, end_ms)))
+
+        # Trivia responses (elapsed_ms already stored); answers containing commas are quoted
+        for response in self.trivia_responses:
+            is_correct = 1 if response.is_correct else 0
+            rows.append(("Trivia", f"Q{response.question_number}", response.selected_answer, is_correct, response.elapsed_ms))
+        
+        # Format the whole file in memory, then write the encoded bytes in one go
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(("section", "question", "response", "value", "timestamp_ms"))
+        writer.writerows(rows)
+        payload = buffer.getvalue().encode('utf-8')
+        
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                # Header (timestamp now = milliseconds since interactive task start)
-                f.write("section,question,response,value,timestamp_ms\n")
-
-                # Demographics responses
-                if self.all_responses['demographics']:
-                    for key, value in self.all_responses['demographics'].items():
-                        t_ms = self.demographics_time.get(key, int((time.time() - self.start_time) * 1000) if self.start_time else 0)
-                        f.write(f"Demographics,{key},{value},{value},{t_ms}\n")
-
-                # SANDE responses (use recorded ms or fallback to end time)
-                if self.all_responses['sande']:
-                    for key, value in self.all_responses['sande'].items():
-                        t_ms = self.sande_time.get(key, int((time.time() - self.start_time) * 1000) if self.start_time else 0)
-                        f.write(f"SANDE,{key},{value},{value},{t_ms}\n")
-
-                # OSDI responses with correct labels
-                if self.all_responses['osdi']:
-                    osdi_labels = ["Never", "Sometimes", "Often", "Mostly", "Constantly"]
-                    for key, value in self.all_responses['osdi'].items():
-                        option_text = osdi_labels[value]
-                        t_ms = self.osdi_time.get(key, int((time.time() - self.start_time) * 1000) if self.start_time else 0)
-                        f.write(f"OSDI,{key},{option_text},{value},{t_ms}\n")
-
-                # Trivia responses (elapsed_ms already stored)
-                for response in self.trivia_responses:
-                    q_num = response['question_number']
-                    selected = response['selected_answer'].replace(',', ';')
-                    is_correct = 1 if response['is_correct'] else 0
-                    t_ms = response.get('elapsed_ms', 0)
-                    f.write(f"Trivia,Q{q_num},{selected},{is_correct},{t_ms}\n")
+            os.makedirs(save_path, exist_ok=True)
+            with open(filepath, 'wb') as f:
+                f.write(payload)
             
             print(f"Interactive task responses saved to: {filepath}")
         
@@ -2016,31 +2097,50 @@ class InteractiveTaskWindow(tk.Toplevel):
         if not self.start_time:
             return
         
-        elapsed = time.time() - self.start_time
-        remaining = max(0, self.duration_seconds - elapsed)
+        deadline = self.start_time + self.duration_seconds
+        remaining = max(0, deadline - time.perf_counter())
         
-        # Update progress bar
+        # Update progress bar, skipping changes too small to move it by a whole pixel
         if self.duration_seconds > 0:
             progress = remaining / self.duration_seconds
-            self.progress_bar.place(relwidth=progress)
-        
-        # Update timer label
-        minutes = int(remaining // 60)
-        seconds = int(remaining % 60)
-        self.progress_label.config(text=f"Time remaining: {minutes}:{seconds:02d}")
+            if (self._last_ratio is None
+                    or abs(progress - self._last_ratio) * self.progress_canvas.winfo_width() >= 1.0):
+                self._last_ratio = progress
+                self.progress_canvas.set_ratio(progress)
+        
+        # Update timer label only when the displayed second changes
+        remaining_secs = int(remaining)
+        if remaining_secs != self._last_remaining:
+            self._last_remaining = remaining_secs
+            minutes, seconds = divmod(remaining_secs, 60)
+            self.progress_label.config(text=_TIME_REMAINING_FMT % (minutes, seconds))
         
         # Check if time expired
         if remaining <= 0:
             self._show_completion()
             return
         
-        # Schedule next update (smooth animation)
-        self.after(100, self._update_timer)
+        # Schedule next update just after the next whole-second boundary
+        self.after(int((remaining % 1) * 1000) + 50, self._update_timer)
     
     def _complete_and_close(self):
         """Mark as completed and close window"""
         self.completed = True
         self.destroy()
+
+    def _cleanup(self):
+        """Remove variable traces registered by the sections"""
+        for var, trace_id in self._traces:
+            try:
+                var.trace_remove("write", trace_id)
+            except tk.TclError:
+                pass
+        self._traces.clear()
+
+    def destroy(self):
+        self._cancel_sande_drags()
+        self._cleanup()
+        super().destroy()
     
     def on_close_attempt(self):
         """Handle window close attempt"""
@@ -2095,7 +2195,7 @@ def test_full_interactive_task():
     import time
     
     # Record start time
-    task_start = time.time()
+    task_start = time.perf_counter()
     
     # First: Show questionnaires
     print("Starting dry eye questionnaires...")
@@ -2108,7 +2208,7 @@ def test_full_interactive_task():
         return
     
     # Calculate time spent on questionnaires
-    questionnaire_duration = time.time() - task_start
+    questionnaire_duration = time.perf_counter() - task_start
     print(f"Questionnaires completed in {questionnaire_duration:.1f} seconds")
     
     # Second: Show trivia for remaining time
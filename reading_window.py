@@ -55,7 +55,6 @@ def show_reading_window(url, on_ready_callback=None, duration_seconds=300,
     # Shared state for timer and webview
     webview_window = None
     timer_root = None
-    webview_loaded = False
     next_btn_ref = [None]  # mutable ref to the Next Story button widget
     story_label_ref = [None]  # mutable ref to the story counter label
 
@@ -131,16 +130,19 @@ def show_reading_window(url, on_ready_callback=None, duration_seconds=300,
         timer_root.geometry(f'{timer_width}x{bar_height}+{timer_left}+{timer_top}')
         timer_root.attributes('-topmost', True)
 
-        progress_frame = tk.Frame(timer_root, bg='#374151', height=bar_height)
+        # Countdown bar drawn on a canvas; updates only move the filled rectangle
+        progress_frame = tk.Canvas(timer_root, bg='#374151', height=bar_height, highlightthickness=0)
         progress_frame.pack(fill='both', expand=True)
-        progress_frame.pack_propagate(False)
+        progress_bar = progress_frame.create_rectangle(0, 0, 0, bar_height, fill='#10b981', outline='')
+        progress_ratio = [1.0]
 
-        progress_bar = tk.Frame(progress_frame, bg='#10b981')
-        progress_bar.place(x=0, y=0, relwidth=1.0, relheight=1.0)
+        def draw_progress(event=None):
+            progress_frame.coords(progress_bar, 0, 0, progress_frame.winfo_width() * progress_ratio[0], bar_height)
+        progress_frame.bind('<Configure>', draw_progress)
 
         progress_label = tk.Label(
             progress_frame,
-            text=f'Time remaining: {duration_seconds//60}:{duration_seconds%60:02d}',
+            text='Time remaining: %d:%02d' % divmod(duration_seconds, 60),
             bg='#10b981',
             fg='#ffffff',
             font=('Segoe UI', 10)
@@ -173,18 +175,17 @@ def show_reading_window(url, on_ready_callback=None, duration_seconds=300,
         story_label_ref[0] = story_label
 
         start_time = time.time()
+        last_secs = [None]  # whole seconds shown in the label at the last redraw
         def update_timer():
             elapsed = time.time() - start_time
             remaining = max(0, duration_seconds - elapsed)
-            ratio = remaining / duration_seconds if duration_seconds > 0 else 0
-            progress_bar.place(x=0, y=0, relwidth=ratio, relheight=1.0)
-            mins = int(remaining // 60)
-            secs = int(remaining % 60)
-            progress_label.config(text=f'Time remaining: {mins}:{secs:02d}')
-
-            # Reposition timer bar periodically if webview has loaded
-            if webview_loaded:
-                update_timer_position()
+            progress_ratio[0] = remaining / duration_seconds if duration_seconds > 0 else 0
+            draw_progress()
+            remaining_secs = int(remaining)
+            if remaining_secs != last_secs[0]:
+                last_secs[0] = remaining_secs
+                mins, secs = divmod(remaining_secs, 60)
+                progress_label.config(text=f'Time remaining: {mins}:{secs:02d}')
 
             if remaining <= 0:
                 timer_root.after(500, timer_root.destroy)
@@ -192,7 +193,8 @@ def show_reading_window(url, on_ready_callback=None, duration_seconds=300,
                 if webview_window:
                     webview_window.destroy()
             else:
-                timer_root.after(50, update_timer)
+                # Next tick just after the displayed second changes
+                timer_root.after(int((remaining % 1) * 1000) + 50, update_timer)
         update_timer()
         timer_root.mainloop()
 
@@ -215,8 +217,6 @@ def show_reading_window(url, on_ready_callback=None, duration_seconds=300,
     )
 
     def on_loaded():
-        nonlocal webview_loaded
-        webview_loaded = True
         time.sleep(0.1)
         update_timer_position()
 
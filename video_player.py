@@ -45,6 +45,12 @@ class VideoPlayerWindow(tk.Toplevel):
         self.is_paused = False
         self.start_time = None
         self.timer_check_id = None
+        self.end_check_id = None
+        self._play_time_ms = 0  # Playback position, from libvlc time-changed events
+        self._length_ms = 0  # Media length, from libvlc length-changed events
+        self._ended = False  # Set by the libvlc end-reached event; acted on by _check_end
+        self._parsed = False  # Set by the libvlc media-parsed event; picked up by _poll_media_parsed
+        self._last_progress_text = None  # Progress text currently shown while playing
         
         # Fonts
         self.label_font = font.Font(family="Segoe UI", size=11)
@@ -112,12 +118,13 @@ class VideoPlayerWindow(tk.Toplevel):
         # Initialize VLC
         self.instance = None
         self.player = None
+        self.media = None
         
         # Load video
         self.load_video()
         
-        # Autoplay if video file is provided
-        if self.video_file and os.path.exists(self.video_file):
+        # Autoplay if the video was loaded
+        if self.player:
             # Start playing after a short delay to ensure window is ready
             self.after(500, self.toggle_play_pause)
         
@@ -126,7 +133,9 @@ class VideoPlayerWindow(tk.Toplevel):
     
     def load_video(self):
         """Load the video file"""
-        if not self.video_file or not os.path.exists(self.video_file):
+        try:
+            os.stat(self.video_file)  # Single existence check; __init__ autoplays only if this succeeds
+        except OSError:
             messagebox.showerror(
                 "Error",
                 f"Video file not found: {self.video_file}",
@@ -139,6 +148,13 @@ class VideoPlayerWindow(tk.Toplevel):
             self.instance = vlc.Instance('--no-xlib')  # '--no-xlib' for Linux compatibility
             self.player = self.instance.media_player_new()
             
+            # Position, length and end of media arrive as libvlc events on a libvlc thread;
+            # the handlers only store plain values (no Tk calls), which check_progress and _check_end read
+            events = self.player.event_manager()
+            events.event_attach(vlc.EventType.MediaPlayerTimeChanged, self._on_vlc_time_changed)
+            events.event_attach(vlc.EventType.MediaPlayerLengthChanged, self._on_vlc_length_changed)
+            events.event_attach(vlc.EventType.MediaPlayerEndReached, self._on_vlc_end_reached)
+            
             # Set the window handle for video output
             if platform.system() == 'Windows':
                 self.player.set_hwnd(self.video_frame.winfo_id())
@@ -148,21 +164,20 @@ class VideoPlayerWindow(tk.Toplevel):
                 self.player.set_xwindow(self.video_frame.winfo_id())
             
             # Load media
-            media = self.instance.media_new(self.video_file)
-            self.player.set_media(media)
+            self.media = self.instance.media_new(self.video_file)
+            self.player.set_media(self.media)
             
-            # Parse media to get duration
-            media.parse()
-            duration_ms = media.get_duration()
-            duration_sec = duration_ms / 1000 if duration_ms > 0 else 0
+            # Parse media for its duration in the background; libvlc reports completion
+            # on its own thread, so the handler only sets a flag that a Tk timer polls
+            self.media.event_manager().event_attach(vlc.EventType.MediaParsedChanged, self._on_vlc_media_parsed)
+            self.media.parse_with_options(vlc.MediaParseFlag.local, -1)
+            self.after(100, self._poll_media_parsed)
             
             self.progress_label.config(
-                text=f"Ready to play: {os.path.basename(self.video_file)} "
-                     f"({int(duration_sec)}s) [Audio enabled]"
+                text=f"Ready to play: {os.path.basename(self.video_file)} [Audio enabled]"
             )
             
             print(f"Video loaded: {self.video_file}")
-            print(f"  Duration: {duration_sec:.1f}s")
             
             # Signal ready callback
             if self.on_ready_callback:
@@ -176,6 +191,37 @@ class VideoPlayerWindow(tk.Toplevel):
             )
             print(f"Error loading video: {e}")
     
+    def _on_vlc_media_parsed(self, event):
+        """libvlc preparser thread: flag that parsing has finished"""
+        self._parsed = True
+    
+    def _poll_media_parsed(self):
+        """Pick up the parsed flag on the Tk thread"""
+        if not self.winfo_exists():
+            return  # Window closed before parsing finished
+        if self._parsed:
+            self._on_media_parsed()
+        else:
+            self.after(100, self._poll_media_parsed)
+    
+    def _on_media_parsed(self):
+        """Show the duration once the background parse has finished"""
+        duration_ms = max(self.media.get_duration(), 0)  # -1 when unknown
+        duration_sec = duration_ms // 1000
+        
+        # Known length before playback; libvlc length-changed events refine it if needed
+        if not self._length_ms:
+            self._length_ms = duration_ms
+        
+        # Leave the progress text alone once playback has started
+        if self.start_time is None:
+            self.progress_label.config(
+                text=f"Ready to play: {os.path.basename(self.video_file)} "
+                     f"({duration_sec}s) [Audio enabled]"
+            )
+        
+        print(f"  Duration: {duration_ms / 1000:.1f}s")
+    
     def toggle_play_pause(self):
         """Toggle between play and pause"""
         if not self.player:
@@ -188,10 +234,8 @@ class VideoPlayerWindow(tk.Toplevel):
             self.is_paused = True
             self.play_pause_btn.config(text="Resume", bg="#fbbf24")
             
-            # Cancel timer check
-            if self.timer_check_id:
-                self.after_cancel(self.timer_check_id)
-                self.timer_check_id = None
+            # Cancel timer checks
+            self._cancel_checks()
         else:
             # Play/Resume
             if self.start_time is None:
@@ -204,15 +248,54 @@ class VideoPlayerWindow(tk.Toplevel):
             
             # Start checking timer and progress
             self.check_progress()
+            self._check_end()
+    
+    def _on_vlc_time_changed(self, event):
+        """libvlc thread: remember the playback position"""
+        self._play_time_ms = event.u.new_time
+    
+    def _on_vlc_length_changed(self, event):
+        """libvlc thread: remember the media length"""
+        self._length_ms = event.u.new_length
+    
+    def _on_vlc_end_reached(self, event):
+        """libvlc thread: flag the end of the video for _check_end"""
+        self._ended = True
+    
+    # The end of the video and the duration limit are checked this often (plain attribute reads,
+    # no libvlc calls); the progress text only changes once a second, so it is refreshed every 500 ms
+    _END_CHECK_MS = 50
+    
+    def _check_end(self):
+        """Stop the video once libvlc flags its end or the duration limit is reached"""
+        self.end_check_id = None
+        if not self.is_playing or not self.player:
+            return
+        
+        if self._ended or (self.duration_seconds > 0 and self.start_time
+                           and time.time() - self.start_time >= self.duration_seconds):
+            self.stop_video()
+            return
+        
+        self.end_check_id = self.after(self._END_CHECK_MS, self._check_end)
+    
+    def _cancel_checks(self):
+        """Cancel the pending progress and end checks"""
+        if self.timer_check_id:
+            self.after_cancel(self.timer_check_id)
+            self.timer_check_id = None
+        if self.end_check_id:
+            self.after_cancel(self.end_check_id)
+            self.end_check_id = None
     
     def check_progress(self):
-        """Check playback progress and update UI"""
+        """Update the progress text"""
         if not self.is_playing or not self.player:
             return
         
-        # Get current time and length
-        current_time = self.player.get_time() / 1000  # Convert ms to seconds
-        length = self.player.get_length() / 1000  # Convert ms to seconds
+        # Current time and length as last reported by libvlc events
+        current_time = self._play_time_ms / 1000  # Convert ms to seconds
+        length = self._length_ms / 1000  # Convert ms to seconds
         
         if length > 0:
             progress = (current_time / length) * 100
@@ -220,26 +303,18 @@ class VideoPlayerWindow(tk.Toplevel):
         else:
             progress_text = "Playing..."
         
-        # Check duration limit
+        # Time left before the duration limit (enforced by _check_end)
         if self.duration_seconds > 0 and self.start_time:
             elapsed = time.time() - self.start_time
-            if elapsed >= self.duration_seconds:
-                self.stop_video()
-                return
-            
             remaining = max(0, self.duration_seconds - elapsed)
             progress_text += f" | Time remaining: {int(remaining)}s"
         
-        self.progress_label.config(text=progress_text)
-        
-        # Check if video ended
-        state = self.player.get_state()
-        if state == vlc.State.Ended:
-            self.stop_video()
-            return
+        if progress_text != self._last_progress_text:
+            self._last_progress_text = progress_text
+            self.progress_label.config(text=progress_text)
         
         # Schedule next check
-        self.timer_check_id = self.after(100, self.check_progress)
+        self.timer_check_id = self.after(500, self.check_progress)
     
     def stop_video(self):
         """Stop video playback"""
@@ -251,10 +326,8 @@ class VideoPlayerWindow(tk.Toplevel):
         self.player.stop()
         self.play_pause_btn.config(text="Play", bg="#10b981")
         
-        # Cancel timer check
-        if self.timer_check_id:
-            self.after_cancel(self.timer_check_id)
-            self.timer_check_id = None
+        # Cancel timer checks
+        self._cancel_checks()
         
         elapsed = time.time() - self.start_time if self.start_time else 0
         self.progress_label.config(